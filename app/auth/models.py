@@ -2,6 +2,7 @@
 User database model for FastAPI Users.
 """
 from fastapi_users.db import SQLAlchemyBaseUserTableUUID
+from sqlalchemy import Index, func
 
 from app.core.database import Base
 
@@ -24,3 +25,7 @@ class User(SQLAlchemyBaseUserTableUUID, Base):
     """
     pass
 
+
+# fastapi-users looks users up with `lower(email) = lower(:email)`, which the
+# plain unique index on `email` cannot serve; index the lowered value too.
+Index("ix_user_email_lower", func.lower(User.email), unique=True)
@@ -1,43 +1,53 @@
 """
 Authentication router configuration.
 """
+from functools import lru_cache
+
 from fastapi import APIRouter
+from starlette.routing import compile_path
 
 from app.auth.schemas import UserCreate, UserRead, UserUpdate
 from app.auth.users import auth_backend, fastapi_users
 
-# Create router for all auth endpoints
-router = APIRouter()
-
-# Include authentication routes
-router.include_router(
-    fastapi_users.get_auth_router(auth_backend),
-    prefix="/jwt",
-    tags=["auth"],
-)
-
-# Include registration routes
-router.include_router(
-    fastapi_users.get_register_router(UserRead, UserCreate),
-    tags=["auth"],
-)
-
-# Include password reset routes
-router.include_router(
-    fastapi_users.get_reset_password_router(),
-    tags=["auth"],
-)
-
-# Include email verification routes
-router.include_router(
-    fastapi_users.get_verify_router(UserRead),
-    tags=["auth"],
-)
-
-# Include user management routes
-router.include_router(
-    fastapi_users.get_users_router(UserRead, UserUpdate),
-    prefix="/users",
-    tags=["users"],
-)
 
+@lru_cache(maxsize=1)
+def get_auth_router() -> APIRouter:
+    """
+    Build the combined router for all auth endpoints.
+    
+    The fastapi-users sub-routers introspect the user schemas when built,
+    so this is done once per process and the result is reused if the app
+    mounts the auth routes under more than one prefix.
+    
+    Routes are moved over in a single pass instead of calling
+    `include_router` per sub-router, which would rebuild every route.
+    """
+    auth_router = APIRouter()
+
+    subrouters = (
+        # Authentication routes
+        (fastapi_users.get_auth_router(auth_backend), "/jwt", ["auth"]),
+        # Registration routes
+        (fastapi_users.get_register_router(UserRead, UserCreate), "", ["auth"]),
+        # Password reset routes
+        (fastapi_users.get_reset_password_router(), "", ["auth"]),
+        # Email verification routes
+        (fastapi_users.get_verify_router(UserRead), "", ["auth"]),
+        # User management routes
+        (fastapi_users.get_users_router(UserRead, UserUpdate), "/users", ["users"]),
+    )
+
+    for subrouter, prefix, tags in subrouters:
+        for route in subrouter.routes:
+            route.path = prefix + route.path
+            route.path_regex, route.path_format, route.param_convertors = compile_path(
+                route.path
+            )
+            route.tags = tags
+            auth_router.routes.append(route)
+
+    return auth_router
+
+
+# Router for all auth endpoints
+router = get_auth_router()
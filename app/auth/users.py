@@ -1,29 +1,92 @@
 """
 FastAPI Users configuration and user manager.
 """
-from typing import AsyncGenerator
+import hashlib
+import logging
+import time
+from collections import OrderedDict
 from uuid import UUID
 
+import jwt
+import orjson
 from fastapi import Depends
-from fastapi_users import BaseUserManager, FastAPIUsers, UUIDIDMixin
+from fastapi.concurrency import run_in_threadpool
+from fastapi.security import OAuth2PasswordRequestForm
+from fastapi_users import BaseUserManager, FastAPIUsers, UUIDIDMixin, exceptions
 from fastapi_users.authentication import (
     AuthenticationBackend,
     BearerTransport,
     JWTStrategy,
 )
 from fastapi_users.db import SQLAlchemyUserDatabase
+from fastapi_users.jwt import decode_jwt
+from fastapi_users.password import PasswordHelper
+from jwt.utils import base64url_encode
+from pwdlib import PasswordHash
+from pwdlib.hashers.argon2 import Argon2Hasher
+from pwdlib.hashers.bcrypt import BcryptHasher
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.auth.models import User
 from app.core.config import settings
 from app.core.database import get_async_session
 
+logger = logging.getLogger("auth.usermanager")
+
+# Argon2id (OWASP parameters: 64 MiB, 3 iterations, 2 lanes) for new hashes.
+# Existing bcrypt hashes still verify and are rehashed to Argon2id on login.
+password_helper = PasswordHelper(
+    PasswordHash(
+        (
+            Argon2Hasher(time_cost=3, memory_cost=65536, parallelism=2),
+            BcryptHasher(),
+        )
+    )
+)
+
+# Successful password verifications, keyed by a digest of (stored hash, password)
+PASSWORD_CACHE_MAX_SIZE = 4096
+PASSWORD_CACHE_TTL_SECONDS = 60.0
+_verified_passwords: OrderedDict[bytes, float] = OrderedDict()
+
+
+def _password_cache_key(hashed_password: str, plain_password: str) -> bytes:
+    """Build a cache key that never stores the plain password itself."""
+    return hashlib.blake2b(
+        hashed_password.encode() + b"|" + plain_password.encode(),
+        digest_size=16,
+    ).digest()
+
+
+def _is_password_cached(key: bytes) -> bool:
+    """Check the verification cache, dropping the entry if it has expired."""
+    expires_at = _verified_passwords.get(key)
+    if expires_at is None:
+        return False
+    if time.monotonic() > expires_at:
+        _verified_passwords.pop(key, None)
+        return False
+    _verified_passwords.move_to_end(key)
+    return True
+
+
+def _cache_verified_password(key: bytes) -> None:
+    """Remember a successful verification, evicting the oldest entries."""
+    _verified_passwords[key] = time.monotonic() + PASSWORD_CACHE_TTL_SECONDS
+    _verified_passwords.move_to_end(key)
+    while len(_verified_passwords) > PASSWORD_CACHE_MAX_SIZE:
+        _verified_passwords.popitem(last=False)
+
 
 async def get_user_db(
     session: AsyncSession = Depends(get_async_session),
-) -> AsyncGenerator[SQLAlchemyUserDatabase, None]:
-    """Get the user database adapter."""
-    yield SQLAlchemyUserDatabase(session, User)
+) -> SQLAlchemyUserDatabase:
+    """Get the user database adapter, reusing one already bound to the session."""
+    user_db = session.info.get("user_db")
+    if user_db is None:
+        user_db = SQLAlchemyUserDatabase(session, User)
+        session.info["user_db"] = user_db
+    return user_db
 
 
 class UserManager(UUIDIDMixin, BaseUserManager[User, UUID]):
@@ -39,45 +102,160 @@ class UserManager(UUIDIDMixin, BaseUserManager[User, UUID]):
     reset_password_token_secret = settings.secret_key
     verification_token_secret = settings.secret_key
 
+    async def authenticate(
+        self, credentials: OAuth2PasswordRequestForm
+    ) -> User | None:
+        """
+        Authenticate a user by email and password.
+        
+        Successful verifications are cached for a short TTL so clients that
+        re-authenticate frequently skip the password hash. Failures are never
+        cached, and the key includes the stored hash so a password change
+        invalidates it.
+        """
+        try:
+            user = await self.get_by_email(credentials.username)
+        except exceptions.UserNotExists:
+            # Run the hasher to mitigate timing attack
+            await run_in_threadpool(self.password_helper.hash, credentials.password)
+            return None
+        
+        cache_key = _password_cache_key(user.hashed_password, credentials.password)
+        if _is_password_cached(cache_key):
+            return user
+        
+        # Hashing is CPU-bound; keep it off the event loop
+        verified, updated_password_hash = await run_in_threadpool(
+            self.password_helper.verify_and_update,
+            credentials.password,
+            user.hashed_password,
+        )
+        if not verified:
+            return None
+        
+        # Upgrade password hash to a more robust one if needed
+        if updated_password_hash is not None:
+            await self.user_db.update(user, {"hashed_password": updated_password_hash})
+            cache_key = _password_cache_key(updated_password_hash, credentials.password)
+        
+        _cache_verified_password(cache_key)
+        return user
+
     async def on_after_register(
         self, user: User, request=None
     ) -> None:
         """Handle post-registration logic."""
-        print(f"User {user.id} has registered.")
+        logger.info("User %s has registered.", user.id)
         # TODO: Send welcome email, create default resources, etc.
 
     async def on_after_forgot_password(
         self, user: User, token: str, request=None
     ) -> None:
         """Handle password reset request."""
-        print(f"User {user.id} has requested password reset. Token: {token}")
+        logger.info("User %s has requested password reset. Token: %s", user.id, token)
         # TODO: Send password reset email with token
 
     async def on_after_request_verify(
         self, user: User, token: str, request=None
     ) -> None:
         """Handle email verification request."""
-        print(f"Verification requested for user {user.id}. Token: {token}")
+        logger.info("Verification requested for user %s. Token: %s", user.id, token)
         # TODO: Send verification email with token
 
 
 async def get_user_manager(
     user_db: SQLAlchemyUserDatabase = Depends(get_user_db),
-) -> AsyncGenerator[UserManager, None]:
+) -> UserManager:
     """Get the user manager instance."""
-    yield UserManager(user_db)
+    return UserManager(user_db, password_helper)
 
 
 # JWT Authentication Configuration
 bearer_transport = BearerTransport(tokenUrl="auth/jwt/login")
 
 
+class ThreadpoolJWTStrategy(JWTStrategy[User, UUID]):
+    """
+    JWT strategy that signs and verifies tokens in the threadpool.
+    
+    PyJWT encode/decode is synchronous CPU work; running it off the event
+    loop keeps concurrent authenticated requests from serializing on it.
+    Tokens are signed with PyJWT's algorithm objects but the header and
+    payload are serialized with orjson.
+    """
+
+    def __init__(
+        self,
+        secret: str,
+        lifetime_seconds: int | None,
+        algorithm: str = "HS256",
+        public_key: str | None = None,
+    ):
+        super().__init__(
+            secret=secret,
+            lifetime_seconds=lifetime_seconds,
+            algorithm=algorithm,
+            public_key=public_key,
+        )
+        self._signer = jwt.get_algorithm_by_name(algorithm)
+        self._signing_key = self._signer.prepare_key(self.encode_key)
+        header = orjson.dumps({"alg": algorithm, "typ": "JWT"}, option=orjson.OPT_SORT_KEYS)
+        self._encoded_header = base64url_encode(header)
+
+    def _encode_token(self, data: dict) -> str:
+        """Serialize and sign a token payload."""
+        payload = dict(data)
+        if self.lifetime_seconds:
+            payload["exp"] = int(time.time()) + self.lifetime_seconds
+        signing_input = self._encoded_header + b"." + base64url_encode(orjson.dumps(payload))
+        signature = self._signer.sign(signing_input, self._signing_key)
+        return (signing_input + b"." + base64url_encode(signature)).decode()
+
+    async def read_token(
+        self, token: str | None, user_manager: BaseUserManager[User, UUID]
+    ) -> User | None:
+        """Decode the token in the threadpool and resolve its user."""
+        if token is None:
+            return None
+
+        try:
+            data = await run_in_threadpool(
+                decode_jwt,
+                token,
+                self.decode_key,
+                self.token_audience,
+                algorithms=[self.algorithm],
+            )
+            user_id = data.get("sub")
+            if user_id is None:
+                return None
+        except jwt.PyJWTError:
+            return None
+
+        try:
+            parsed_id = user_manager.parse_id(user_id)
+            return await user_manager.get(parsed_id)
+        except (exceptions.UserNotExists, exceptions.InvalidID):
+            return None
+
+    async def write_token(self, user: User) -> str:
+        """Sign a new token for the user in the threadpool."""
+        data = {"sub": str(user.id), "aud": self.token_audience}
+        return await run_in_threadpool(self._encode_token, data)
+
+
+# Built once at import time; fastapi-users calls get_strategy on every request
+_jwt_strategy = ThreadpoolJWTStrategy(
+    secret=settings.jwt_private_key or settings.secret_key,
+    lifetime_seconds=settings.access_token_lifetime_seconds,
+    algorithm=settings.algorithm,
+    public_key=settings.jwt_public_key or None,
+)
+
+
 def get_jwt_strategy() -> JWTStrategy:
-    """Get JWT strategy for authentication."""
-    return JWTStrategy(
-        secret=settings.secret_key,
-        lifetime_seconds=settings.access_token_expire_minutes * 60,
-    )
+    """Get the shared JWT strategy for authentication."""
+    return _jwt_strategy
 
 
 auth_backend = AuthenticationBackend(
@@ -1,9 +1,16 @@
 """
 Application configuration settings.
 """
+import os
+from dataclasses import asdict, dataclass
 from functools import lru_cache
+
+import orjson
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+# Pre-validated settings handed down from a parent process (see dump_settings_json)
+SETTINGS_JSON_ENV = "APP_SETTINGS_JSON"
+
 
 class Settings(BaseSettings):
     """Application settings loaded from environment variables."""
@@ -25,6 +32,9 @@ class Settings(BaseSettings):
     # Security
     secret_key: str = "your-super-secret-key-change-in-production"
     algorithm: str = "HS256"
+    # PEM keys for asymmetric JWT algorithms (e.g. EdDSA); unused for HS256
+    jwt_private_key: str = ""
+    jwt_public_key: str = ""
     access_token_expire_minutes: int = 10080  # 7 days
     
     # CORS - Use ["*"] to allow all origins
@@ -33,12 +43,96 @@ class Settings(BaseSettings):
     # OpenAI Configuration
     openai_api_key: str = ""
     openai_model: str = "gpt-4o-mini"
+    # Shared HTTP connection pool to the OpenAI API
+    openai_max_connections: int = 200
+    openai_max_keepalive: int = 100
+    # Concurrent chat completions allowed, and retries per request
+    openai_max_concurrency: int = 50
+    openai_max_retries: int = 5
+    
+    # Semantic cache for question generation and answer evaluation
+    semantic_cache_enabled: bool = False
+    semantic_cache_embedding_model: str = "text-embedding-3-small"
+    semantic_cache_question_threshold: float = 0.85
+    semantic_cache_evaluation_threshold: float = 0.95
+    semantic_cache_max_entries: int = 1024
+    
+    # Deferred final reports are collected for this long, then submitted
+    # together through the OpenAI Batch API
+    report_batch_window_seconds: float = 60.0
+    report_batch_poll_seconds: float = 30.0
+
+
+# Immutable snapshot of Settings used at runtime. Plain slotted dataclass
+# attribute reads are cheaper than going through pydantic on hot paths.
+# Must declare every Settings field; get_settings fails loudly otherwise.
+@dataclass(frozen=True, slots=True)
+class FrozenSettings:
+    """Frozen, typed copy of the loaded application settings."""
+    
+    # Application
+    app_name: str
+    app_version: str
+    debug: bool
+    
+    # Database
+    database_url: str
+    
+    # Security
+    secret_key: str
+    algorithm: str
+    jwt_private_key: str
+    jwt_public_key: str
+    access_token_expire_minutes: int
+    
+    # CORS - Use ["*"] to allow all origins
+    cors_origins: list[str]
+    
+    # OpenAI Configuration
+    openai_api_key: str
+    openai_model: str
+    openai_max_connections: int
+    openai_max_keepalive: int
+    openai_max_concurrency: int
+    openai_max_retries: int
+    
+    # Semantic cache
+    semantic_cache_enabled: bool
+    semantic_cache_embedding_model: str
+    semantic_cache_question_threshold: float
+    semantic_cache_evaluation_threshold: float
+    semantic_cache_max_entries: int
+    
+    # Deferred report batching
+    report_batch_window_seconds: float
+    report_batch_poll_seconds: float
+    
+    # Derived from access_token_expire_minutes
+    access_token_lifetime_seconds: int
 
 
 @lru_cache
-def get_settings() -> Settings:
-    """Get cached settings instance."""
-    return Settings()
+def get_settings() -> FrozenSettings:
+    """
+    Load settings once and return a frozen snapshot.
+    
+    If APP_SETTINGS_JSON is set, the snapshot is rebuilt from it directly,
+    skipping .env parsing and Pydantic validation in worker processes.
+    """
+    settings_json = os.environ.get(SETTINGS_JSON_ENV)
+    if settings_json:
+        return FrozenSettings(**orjson.loads(settings_json))
+
+    loaded = Settings()
+    return FrozenSettings(
+        **loaded.model_dump(),
+        access_token_lifetime_seconds=loaded.access_token_expire_minutes * 60,
+    )
+
+
+def dump_settings_json() -> str:
+    """Serialize the loaded settings for export as APP_SETTINGS_JSON."""
+    return orjson.dumps(asdict(get_settings())).decode()
 
 
 settings = get_settings()
@@ -1,8 +1,10 @@
 """
 Database configuration and session management.
 """
+import asyncio
 from typing import AsyncGenerator
 
+from fastapi import Request
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase
 
@@ -34,8 +36,16 @@ async def create_db_and_tables() -> None:
         await conn.run_sync(Base.metadata.create_all)
 
 
-async def get_async_session() -> AsyncGenerator[AsyncSession, None]:
-    """Dependency to get async database session."""
+async def get_async_session(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    """
+    Dependency to get async database session.
+    
+    Waits for the table creation started in the app lifespan, shielded so
+    a cancelled request doesn't cancel it.
+    """
+    db_init_task = getattr(request.app.state, "db_init_task", None)
+    if db_init_task is not None and not db_init_task.done():
+        await asyncio.shield(db_init_task)
     async with async_session_maker() as session:
         yield session
 
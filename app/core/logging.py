@@ -0,0 +1,41 @@
+"""
+Logging configuration.
+
+Log records are handed to a background thread through a queue so that
+writing to stderr never blocks the event loop.
+"""
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+
+from app.core.config import settings
+
+_listener: QueueListener | None = None
+
+
+def setup_logging() -> None:
+    """Route root logging through a QueueHandler and start the listener."""
+    global _listener
+    if _listener is not None:
+        return
+
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(
+        logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s")
+    )
+
+    root = logging.getLogger()
+    root.addHandler(QueueHandler(log_queue))
+    root.setLevel(logging.DEBUG if settings.debug else logging.INFO)
+
+    _listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    _listener.start()
+
+
+def shutdown_logging() -> None:
+    """Flush pending records and stop the background listener."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
@@ -1,28 +1,30 @@
 """
 Pydantic models for Interview API requests and responses.
 """
-from enum import Enum
-from typing import Any
+import asyncio
+from collections import deque
+from typing import Any, Literal
 from uuid import UUID
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
+from pydantic.json_schema import SkipJsonSchema
+# Pydantic only accepts typing.TypedDict as a response model on Python 3.12+
+from typing_extensions import TypedDict
 
 
 # ============================================================================
-# Enums
+# Literal Types
 # ============================================================================
+# Plain string literals rather than Enums: validated with a set membership
+# check and serialized as-is, with no Enum member lookups per request.
+# Values are ordinary str at runtime, so f-strings, JSON and comparisons
+# use them directly without any .value indirection.
 
-class Difficulty(str, Enum):
-    """Question difficulty level."""
-    EASY = "easy"
-    MEDIUM = "medium"
-    HARD = "hard"
+# Question difficulty level, in ascending order
+Difficulty = Literal["easy", "medium", "hard"]
 
-
-class InterviewStatus(str, Enum):
-    """Interview session status."""
-    IN_PROGRESS = "in_progress"
-    COMPLETED = "completed"
+# Interview session status
+InterviewStatus = Literal["in_progress", "completed"]
 
 
 # ============================================================================
@@ -31,6 +33,8 @@ class InterviewStatus(str, Enum):
 
 class StartInterviewRequest(BaseModel):
     """Request model for starting a new interview."""
+    model_config = ConfigDict(frozen=True)
+
     experience_years: int = Field(
         ...,
         ge=0,
@@ -57,6 +61,8 @@ class StartInterviewRequest(BaseModel):
 
 class SubmitAnswerRequest(BaseModel):
     """Request model for submitting an answer."""
+    model_config = ConfigDict(frozen=True)
+
     interview_id: UUID = Field(
         ...,
         description="Unique identifier for the interview session"
@@ -102,12 +108,12 @@ class QuestionEvaluation(BaseModel):
         ...,
         description="Assessment of practical understanding"
     )
-    strengths: list[str] = Field(
-        default_factory=list,
+    strengths: tuple[str, ...] = Field(
+        default=(),
         description="List of strengths in the answer"
     )
-    areas_for_improvement: list[str] = Field(
-        default_factory=list,
+    areas_for_improvement: tuple[str, ...] = Field(
+        default=(),
         description="Areas where the candidate can improve"
     )
     feedback: str = Field(
@@ -136,6 +142,54 @@ class InterviewQuestion(BaseModel):
     )
 
 
+# ============================================================================
+# Bulk Evaluation Models
+# ============================================================================
+
+class BulkEvaluationItem(BaseModel):
+    """A single answer to evaluate in a bulk request."""
+    model_config = ConfigDict(frozen=True)
+
+    question: InterviewQuestion
+    answer: str = Field(
+        ...,
+        min_length=1,
+        max_length=10000,
+        description="Candidate's answer to the question"
+    )
+    experience_years: int = Field(
+        ...,
+        ge=0,
+        le=50,
+        description="Candidate's years of experience (0 for fresher)"
+    )
+    subject: str = Field(
+        ...,
+        min_length=2,
+        max_length=100,
+        description="Technical subject of the question"
+    )
+
+
+class BulkEvaluateRequest(BaseModel):
+    """Request model for evaluating many answers at once."""
+    model_config = ConfigDict(frozen=True)
+
+    items: tuple[BulkEvaluationItem, ...] = Field(
+        ...,
+        min_length=1,
+        max_length=100,
+        description="Answers to evaluate"
+    )
+
+
+class BulkEvaluateResponse(BaseModel):
+    """Response for a bulk evaluation, in request order."""
+    model_config = ConfigDict(frozen=True)
+
+    evaluations: tuple[QuestionEvaluation, ...]
+
+
 # ============================================================================
 # Response Models - Interview State
 # ============================================================================
@@ -145,10 +199,46 @@ class QuestionAnswerRecord(BaseModel):
     question: InterviewQuestion
     answer: str | None = None
     evaluation: QuestionEvaluation | None = None
+    # Truncated answers for reports, computed once when the answer is set
+    _report_excerpt: str = PrivateAttr(default="No answer")
+    _answer_summary: str = PrivateAttr(default="")
+
+    def model_post_init(self, __context: Any) -> None:
+        if self.answer is not None:
+            self.set_answer(self.answer)
+
+    def set_answer(self, answer: str) -> None:
+        """Set the answer and precompute its truncated forms."""
+        self.answer = answer
+        self._report_excerpt = answer[:500] + "..." if len(answer) > 500 else answer
+        self._answer_summary = answer[:200] + "..." if len(answer) > 200 else answer
+
+    @property
+    def report_excerpt(self) -> str:
+        """Answer truncated to 500 characters, for the final report prompt."""
+        return self._report_excerpt
+
+    @property
+    def answer_summary(self) -> str:
+        """Answer truncated to 200 characters, for the report breakdown."""
+        return self._answer_summary
+
+
+def format_history_entry(question: InterviewQuestion, score: int | None) -> str:
+    """
+    Format one question for the history section of the question prompt.
+    
+    Entries give the topic rather than the question text, which keeps the
+    prompt short while still steering the model away from repeats.
+    """
+    eval_info = f" (Score: {score}/10)" if score is not None else ""
+    return f"- Q{question.question_number} [{question.difficulty}] {question.topic}{eval_info}\n"
 
 
 class InterviewConfig(BaseModel):
     """Interview configuration."""
+    model_config = ConfigDict(frozen=True)
+
     experience_years: int
     subject: str
     difficulty: Difficulty
@@ -157,11 +247,60 @@ class InterviewConfig(BaseModel):
 
 class InterviewState(BaseModel):
     """Complete interview state."""
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
     interview_id: UUID
     config: InterviewConfig
     current_question_num: int
     conversation_history: list[QuestionAnswerRecord]
     status: InterviewStatus
+    # One line per answered question for the question prompt (rebuilt from history on load)
+    running_summary: SkipJsonSchema[str] = Field(
+        default="",
+        exclude=True,
+        repr=False,
+    )
+    # Last 3 evaluation scores, for adaptive difficulty (rebuilt from history on load)
+    recent_scores: SkipJsonSchema[deque[int]] = Field(
+        default_factory=lambda: deque(maxlen=3),
+        exclude=True,
+        repr=False,
+    )
+    # Background generation of the next question (runtime only, not serialized)
+    pending_next_question: SkipJsonSchema[asyncio.Task | None] = Field(
+        default=None,
+        exclude=True,
+        repr=False,
+    )
+    pending_next_difficulty: SkipJsonSchema[Difficulty | None] = Field(
+        default=None,
+        exclude=True,
+        repr=False,
+    )
+    # Report produced by a deferred batch job, served on the next request
+    final_report: SkipJsonSchema["FinalReportResponse | None"] = Field(
+        default=None,
+        exclude=True,
+        repr=False,
+    )
+
+    def model_post_init(self, __context: Any) -> None:
+        # The derived fields aren't serialized; rebuild them from the history
+        # so a state loaded from storage keeps its adaptive difficulty and
+        # prompt history
+        rebuild_summary = "running_summary" not in self.model_fields_set
+        rebuild_scores = "recent_scores" not in self.model_fields_set
+        if not (rebuild_summary or rebuild_scores):
+            return
+        for record in self.conversation_history:
+            if record.evaluation is None:
+                continue
+            if rebuild_summary:
+                self.running_summary += format_history_entry(
+                    record.question, record.evaluation.score
+                )
+            if rebuild_scores:
+                self.recent_scores.append(record.evaluation.score)
 
 
 # ============================================================================
@@ -170,6 +309,8 @@ class InterviewState(BaseModel):
 
 class StartInterviewResponse(BaseModel):
     """Response for starting a new interview."""
+    model_config = ConfigDict(frozen=True)
+
     interview_id: UUID
     first_question: InterviewQuestion
     total_questions: int
@@ -178,6 +319,8 @@ class StartInterviewResponse(BaseModel):
 
 class SubmitAnswerResponse(BaseModel):
     """Response for submitting an answer."""
+    model_config = ConfigDict(frozen=True)
+
     evaluation: QuestionEvaluation
     next_question: InterviewQuestion | None = None
     is_complete: bool
@@ -187,6 +330,8 @@ class SubmitAnswerResponse(BaseModel):
 
 class QuestionBreakdown(BaseModel):
     """Breakdown of a single question in the final report."""
+    model_config = ConfigDict(frozen=True)
+
     question_number: int
     question: str
     topic: str
@@ -198,6 +343,8 @@ class QuestionBreakdown(BaseModel):
 
 class FinalReportResponse(BaseModel):
     """Final interview report."""
+    model_config = ConfigDict(frozen=True)
+
     interview_id: UUID
     overall_score: float = Field(
         ...,
@@ -213,20 +360,20 @@ class FinalReportResponse(BaseModel):
         ...,
         description="Comprehensive assessment narrative"
     )
-    strong_areas: list[str] = Field(
-        default_factory=list,
+    strong_areas: tuple[str, ...] = Field(
+        default=(),
         description="Areas where candidate performed well"
     )
-    weak_areas: list[str] = Field(
-        default_factory=list,
+    weak_areas: tuple[str, ...] = Field(
+        default=(),
         description="Areas needing improvement"
     )
-    question_wise_breakdown: list[QuestionBreakdown] = Field(
-        default_factory=list,
+    question_wise_breakdown: tuple[QuestionBreakdown, ...] = Field(
+        default=(),
         description="Detailed breakdown for each question"
     )
-    recommendations: list[str] = Field(
-        default_factory=list,
+    recommendations: tuple[str, ...] = Field(
+        default=(),
         description="Actionable recommendations for improvement"
     )
     hire_recommendation: str = Field(
@@ -239,19 +386,29 @@ class FinalReportResponse(BaseModel):
 # Generic API Response Wrapper
 # ============================================================================
 
-class APIResponse(BaseModel):
-    """Generic API response wrapper."""
-    success: bool = True
-    data: Any = None
-    error: str | None = None
+class APIResponse(TypedDict):
+    """
+    Generic API response wrapper.
+    
+    A TypedDict rather than a model: instances are plain dicts that go
+    straight to the JSON encoder without any Pydantic validation.
+    """
+    success: bool
+    data: Any
+    error: str | None
+
+
+def success_response(data: Any) -> APIResponse:
+    """Create a success response."""
+    return APIResponse(success=True, data=data, error=None)
+
 
-    @classmethod
-    def success_response(cls, data: Any) -> "APIResponse":
-        """Create a success response."""
-        return cls(success=True, data=data, error=None)
+def error_response(error: str) -> APIResponse:
+    """Create an error response."""
+    return APIResponse(success=False, data=None, error=error)
 
-    @classmethod
-    def error_response(cls, error: str) -> "APIResponse":
-        """Create an error response."""
-        return cls(success=False, data=None, error=error)
 
+# InterviewState refers to FinalReportResponse before it is defined, so its
+# schema can only be completed here; every other model's schema was built
+# when its class was defined
+InterviewState.model_rebuild()
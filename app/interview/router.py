@@ -5,22 +5,26 @@ Defines all interview-related endpoints:
 - POST /start - Start a new interview
 - POST /answer - Submit an answer
 - GET /report/{interview_id} - Get final report
+- GET /report/{interview_id}/stream - Stream the final report (SSE)
 - GET /status/{interview_id} - Get interview status
 - GET /question/{interview_id} - Get current question
+- POST /evaluate/bulk - Evaluate many answers at once (superusers only)
 """
+from typing import Any, AsyncIterator
 from uuid import UUID
 
-from fastapi import APIRouter, HTTPException, status
+import orjson
+from fastapi import APIRouter, Depends, Request, status
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from pydantic import BaseModel
 
+from app.auth.users import current_superuser
 from app.interview.models import (
     APIResponse,
-    FinalReportResponse,
-    InterviewQuestion,
-    InterviewState,
+    BulkEvaluateRequest,
     StartInterviewRequest,
-    StartInterviewResponse,
     SubmitAnswerRequest,
-    SubmitAnswerResponse,
+    success_response,
 )
 from app.interview.services.interview_service import (
     InterviewAlreadyCompletedError,
@@ -31,12 +35,61 @@ from app.interview.services.interview_service import (
     get_interview_service,
 )
 
-router = APIRouter(prefix="/interview", tags=["interview"])
+router = APIRouter(
+    prefix="/interview",
+    tags=["interview"],
+    default_response_class=ORJSONResponse,
+)
+
+
+async def get_service(request: Request) -> InterviewService:
+    """Dependency to get interview service (async, so it skips the threadpool)."""
+    return get_interview_service(request)
+
+
+def json_success_response(
+    data: BaseModel | dict[str, Any],
+    status_code: int = status.HTTP_200_OK,
+) -> ORJSONResponse:
+    """
+    Wrap data in the standard APIResponse envelope.
+    
+    Returning the response directly skips FastAPI's response-model
+    validation; `response_model=APIResponse` is kept for the OpenAPI docs.
+    """
+    if isinstance(data, BaseModel):
+        data = data.model_dump()
+    return ORJSONResponse(
+        content=success_response(data),
+        status_code=status_code,
+    )
+
+
+# ============================================================================
+# Error Handling
+# ============================================================================
+
+_ERROR_STATUS_CODES: dict[type[InterviewServiceError], int] = {
+    InterviewNotFoundError: status.HTTP_404_NOT_FOUND,
+    InterviewAlreadyCompletedError: status.HTTP_400_BAD_REQUEST,
+    InvalidQuestionNumberError: status.HTTP_400_BAD_REQUEST,
+}
 
 
-def get_service() -> InterviewService:
-    """Dependency to get interview service."""
-    return get_interview_service()
+async def interview_service_error_handler(
+    request: Request,
+    exc: InterviewServiceError,
+) -> ORJSONResponse:
+    """
+    Translate service errors into HTTP error responses.
+    
+    Registered on the application so endpoints don't need their own
+    try/except blocks; any other service error maps to 400.
+    """
+    return ORJSONResponse(
+        status_code=_ERROR_STATUS_CODES.get(type(exc), status.HTTP_400_BAD_REQUEST),
+        content={"detail": str(exc)},
+    )
 
 
 # ============================================================================
@@ -52,7 +105,8 @@ def get_service() -> InterviewService:
 )
 async def start_interview(
     request: StartInterviewRequest,
-) -> APIResponse:
+    service: InterviewService = Depends(get_service),
+) -> ORJSONResponse:
     """
     Start a new interview session.
     
@@ -64,16 +118,8 @@ async def start_interview(
     - **difficulty**: easy, medium, or hard
     - **num_questions**: Number of questions (1-20, default 5)
     """
-    service = get_service()
-    
-    try:
-        response = await service.start_interview(request)
-        return APIResponse.success_response(response.model_dump())
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to start interview: {str(e)}",
-        )
+    response = await service.start_interview(request)
+    return json_success_response(response, status_code=status.HTTP_201_CREATED)
 
 
 @router.post(
@@ -84,7 +130,8 @@ async def start_interview(
 )
 async def submit_answer(
     request: SubmitAnswerRequest,
-) -> APIResponse:
+    service: InterviewService = Depends(get_service),
+) -> ORJSONResponse:
     """
     Submit an answer to the current interview question.
     
@@ -95,31 +142,8 @@ async def submit_answer(
     - **answer**: Your answer to the current question
     - **question_number**: The question number being answered
     """
-    service = get_service()
-    
-    try:
-        response = await service.submit_answer(request)
-        return APIResponse.success_response(response.model_dump())
-    except InterviewNotFoundError as e:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=str(e),
-        )
-    except InterviewAlreadyCompletedError as e:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(e),
-        )
-    except InvalidQuestionNumberError as e:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(e),
-        )
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to process answer: {str(e)}",
-        )
+    response = await service.submit_answer(request)
+    return json_success_response(response)
 
 
 @router.get(
@@ -130,7 +154,9 @@ async def submit_answer(
 )
 async def get_report(
     interview_id: UUID,
-) -> APIResponse:
+    defer: bool = False,
+    service: InterviewService = Depends(get_service),
+) -> ORJSONResponse:
     """
     Get the final comprehensive report for a completed interview.
     
@@ -141,27 +167,49 @@ async def get_report(
     - Strengths and areas for improvement
     - Actionable recommendations
     - Hiring recommendation
+    
+    - **defer**: Queue the report for cheaper batch generation and return
+      202; request the report again later to retrieve it
     """
-    service = get_service()
+    response = await service.get_report(interview_id, defer=defer)
     
-    try:
-        response = await service.get_report(interview_id)
-        return APIResponse.success_response(response.model_dump())
-    except InterviewNotFoundError as e:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=str(e),
-        )
-    except InterviewServiceError as e:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(e),
-        )
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to generate report: {str(e)}",
+    if response is None:
+        return json_success_response(
+            {
+                "message": "Report queued for batch generation",
+                "report": None,
+            },
+            status_code=status.HTTP_202_ACCEPTED,
         )
+    
+    return json_success_response(response)
+
+
+@router.get(
+    "/report/{interview_id}/stream",
+    summary="Stream final report",
+    description="Stream the final report as server-sent events, one event per field.",
+    response_class=StreamingResponse,
+)
+async def stream_report(
+    interview_id: UUID,
+    service: InterviewService = Depends(get_service),
+) -> StreamingResponse:
+    """
+    Stream the final report for a completed interview.
+    
+    Each report field is sent as an SSE event named after the field, with
+    the JSON-encoded value as data, as soon as it is available. A final
+    `done` event marks the end of the report.
+    """
+    fields = await service.stream_report(interview_id)
+    
+    async def events() -> AsyncIterator[bytes]:
+        async for key, value in fields:
+            yield b"event: " + key.encode() + b"\ndata: " + orjson.dumps(value) + b"\n\n"
+        yield b"event: done\ndata: {}\n\n"
+    
+    return StreamingResponse(events(), media_type="text/event-stream")
 
 
 @router.get(
@@ -172,7 +220,8 @@ async def get_report(
 )
 async def get_interview_status(
     interview_id: UUID,
-) -> APIResponse:
+    service: InterviewService = Depends(get_service),
+) -> ORJSONResponse:
     """
     Get the current status of an interview.
     
@@ -182,21 +231,8 @@ async def get_interview_status(
     - Status (in_progress or completed)
     - Conversation history
     """
-    service = get_service()
-    
-    try:
-        response = await service.get_interview_state(interview_id)
-        return APIResponse.success_response(response.model_dump())
-    except InterviewNotFoundError as e:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=str(e),
-        )
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to get interview status: {str(e)}",
-        )
+    response = await service.get_interview_state(interview_id)
+    return json_success_response(response)
 
 
 @router.get(
@@ -207,33 +243,44 @@ async def get_interview_status(
 )
 async def get_current_question(
     interview_id: UUID,
-) -> APIResponse:
+    service: InterviewService = Depends(get_service),
+) -> ORJSONResponse:
     """
     Get the current question for an interview.
     
     Returns the current unanswered question, or null if the interview
     is complete.
     """
-    service = get_service()
-    
-    try:
-        question = await service.get_current_question(interview_id)
-        
-        if question is None:
-            return APIResponse.success_response({
-                "message": "Interview is complete",
-                "question": None,
-            })
-        
-        return APIResponse.success_response(question.model_dump())
-    except InterviewNotFoundError as e:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=str(e),
-        )
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to get current question: {str(e)}",
-        )
+    question = await service.get_current_question(interview_id)
+    
+    if question is None:
+        return json_success_response({
+            "message": "Interview is complete",
+            "question": None,
+        })
+    
+    return json_success_response(question)
+
 
+@router.post(
+    "/evaluate/bulk",
+    response_model=APIResponse,
+    summary="Evaluate answers in bulk",
+    description="Evaluate many answers concurrently. Requires a superuser.",
+    dependencies=[Depends(current_superuser)],
+)
+async def evaluate_answers_bulk(
+    request: BulkEvaluateRequest,
+    service: InterviewService = Depends(get_service),
+) -> ORJSONResponse:
+    """
+    Evaluate a batch of answers, e.g. when re-scoring after a hiring event.
+    
+    The answers are evaluated concurrently and the evaluations are returned
+    in request order. No interview state is read or changed.
+    
+    - **items**: Up to 100 question/answer pairs with the candidate's
+      experience and subject
+    """
+    response = await service.evaluate_answers_bulk(request)
+    return json_success_response(response)
@@ -4,26 +4,59 @@ Interview service containing core business logic.
 Orchestrates the interview flow, manages state, and coordinates
 between storage and OpenAI services.
 """
+import asyncio
+import logging
+from typing import Any, AsyncIterator
 from uuid import UUID, uuid4
 
+from fastapi import Request
+
+from app.core.config import settings
 from app.interview.models import (
+    BulkEvaluateRequest,
+    BulkEvaluateResponse,
     Difficulty,
     FinalReportResponse,
     InterviewConfig,
     InterviewQuestion,
     InterviewState,
-    InterviewStatus,
     QuestionAnswerRecord,
     QuestionBreakdown,
-    QuestionEvaluation,
     StartInterviewRequest,
     StartInterviewResponse,
     SubmitAnswerRequest,
     SubmitAnswerResponse,
 )
-from app.interview.services.openai_service import OpenAIService, get_openai_service
+from app.interview.services.llm_output import coerce_score, coerce_str_list, coerce_text
+from app.interview.services.openai_service import OpenAIService
 from app.interview.storage import InterviewStorage, get_interview_storage
 
+logger = logging.getLogger(__name__)
+
+# Report fields generated by the LLM; only these are read from its output
+_REPORT_LLM_FIELDS = (
+    "overall_score",
+    "detailed_feedback",
+    "strong_areas",
+    "weak_areas",
+    "recommendations",
+    "hire_recommendation",
+)
+_REPORT_LIST_FIELDS = ("strong_areas", "weak_areas", "recommendations")
+
+# Attempts to persist an interview state before it is left in memory until
+# its next update, and the delay before the first retry (doubled each time)
+WRITE_MAX_ATTEMPTS = 3
+WRITE_RETRY_DELAY_SECONDS = 0.5
+
+
+def _log_task_failure(task: asyncio.Task) -> None:
+    """Done callback logging the exception of a failed background task."""
+    if not task.cancelled() and task.exception() is not None:
+        logger.warning(
+            "Background task %s failed", task.get_name(), exc_info=task.exception()
+        )
+
 
 class InterviewServiceError(Exception):
     """Custom exception for interview service errors."""
@@ -58,18 +91,35 @@ class InterviewService:
     
     def __init__(
         self,
+        openai_service: OpenAIService,
         storage: InterviewStorage | None = None,
-        openai_service: OpenAIService | None = None,
     ):
         """
         Initialize the interview service.
         
         Args:
+            openai_service: OpenAI service instance shared by the application
             storage: Interview storage instance (uses global if not provided)
-            openai_service: OpenAI service instance (uses global if not provided)
         """
         self.storage = storage or get_interview_storage()
-        self.openai = openai_service or get_openai_service()
+        self.openai = openai_service
+        # Completed interviews waiting for the next Batch API submission,
+        # keyed by UUID.int like the storage dicts
+        self._pending_reports: dict[int, InterviewState] = {}
+        self._report_batch_task: asyncio.Task | None = None
+        # Interviews in a submitted batch that hasn't finished yet, and
+        # every batch task still running (for cancellation on shutdown)
+        self._in_flight_reports: set[int] = set()
+        self._report_batch_tasks: set[asyncio.Task] = set()
+        # Write-behind: updated states not yet persisted, keyed by UUID.int,
+        # a version bumped on every update (states are changed in place, so
+        # identity can't tell a newer state apart), and the keys queued for
+        # the background writer
+        self._pending_writes: dict[int, InterviewState] = {}
+        self._write_versions: dict[int, int] = {}
+        self._queued_writes: set[int] = set()
+        self._write_queue: asyncio.Queue[int] = asyncio.Queue()
+        self._write_worker: asyncio.Task | None = None
     
     async def start_interview(
         self,
@@ -120,12 +170,15 @@ class InterviewService:
             config=config,
             current_question_num=1,
             conversation_history=[initial_record],
-            status=InterviewStatus.IN_PROGRESS,
+            status="in_progress",
         )
         
         # Store the interview
         await self.storage.create(interview_state)
         
+        # Start on question 2 while the candidate answers question 1
+        self._prefetch_next_question(interview_state)
+        
         return StartInterviewResponse(
             interview_id=interview_id,
             first_question=first_question,
@@ -155,14 +208,14 @@ class InterviewService:
             InvalidQuestionNumberError: If question number doesn't match
         """
         # Retrieve interview state
-        interview = await self.storage.get(request.interview_id)
+        interview = await self._get_interview(request.interview_id)
         
         if interview is None:
             raise InterviewNotFoundError(
                 f"Interview {request.interview_id} not found or expired"
             )
         
-        if interview.status == InterviewStatus.COMPLETED:
+        if interview.status == "completed":
             raise InterviewAlreadyCompletedError(
                 "This interview has already been completed"
             )
@@ -176,48 +229,61 @@ class InterviewService:
         # Get current question record
         current_record = interview.conversation_history[-1]
         
-        # Evaluate the answer
-        evaluation = await self.openai.evaluate_answer(
+        # Check if interview is complete
+        is_complete = interview.current_question_num >= interview.config.num_questions
+        questions_remaining = interview.config.num_questions - interview.current_question_num
+        next_question = None
+        
+        evaluate = self.openai.evaluate_answer(
             question=current_record.question,
             answer=request.answer,
             experience_years=interview.config.experience_years,
             subject=interview.config.subject,
         )
         
+        if is_complete:
+            evaluation = await evaluate
+        else:
+            # The next question is normally already being generated in the
+            # background (see _prefetch_next_question); otherwise start it
+            # now so it runs alongside the evaluation
+            if interview.pending_next_question is None:
+                self._prefetch_next_question(interview)
+            speculative_difficulty = interview.pending_next_difficulty
+            evaluation, next_question = await asyncio.gather(
+                evaluate,
+                interview.pending_next_question,
+                return_exceptions=True,
+            )
+            interview.pending_next_question = None
+            interview.pending_next_difficulty = None
+            if isinstance(evaluation, BaseException):
+                raise evaluation
+        
         # Update the current record with answer and evaluation
-        current_record.answer = request.answer
+        current_record.set_answer(request.answer)
         current_record.evaluation = evaluation
-        
-        # Check if interview is complete
-        is_complete = interview.current_question_num >= interview.config.num_questions
-        questions_remaining = interview.config.num_questions - interview.current_question_num
-        next_question = None
+        interview.recent_scores.append(evaluation.score)
+        interview.running_summary += self.openai.format_history_entry(
+            current_record.question, evaluation.score
+        )
         
         if is_complete:
             # Mark interview as completed
-            interview.status = InterviewStatus.COMPLETED
+            interview.status = "completed"
         else:
-            # Calculate adaptive difficulty based on recent scores
-            recent_scores = [
-                r.evaluation.score
-                for r in interview.conversation_history
-                if r.evaluation is not None
-            ][-3:]  # Last 3 scores
-            
-            adaptive_difficulty = self.openai.calculate_adaptive_difficulty(
-                current_difficulty=interview.config.difficulty,
-                recent_scores=recent_scores,
-            )
-            
-            # Generate next question
-            next_question = await self.openai.generate_question(
-                experience_years=interview.config.experience_years,
-                subject=interview.config.subject,
-                difficulty=adaptive_difficulty,
-                question_number=interview.current_question_num + 1,
-                total_questions=interview.config.num_questions,
-                previous_records=interview.conversation_history,
-            )
+            # Regenerate if the new score moved the difficulty tier, or if
+            # the speculative generation failed
+            adaptive_difficulty = self._get_adaptive_difficulty(interview)
+            if (
+                isinstance(next_question, BaseException)
+                or adaptive_difficulty != speculative_difficulty
+            ):
+                next_question = await self._generate_question(
+                    interview,
+                    question_number=interview.current_question_num + 1,
+                    difficulty=adaptive_difficulty,
+                )
             
             # Add next question to history
             next_record = QuestionAnswerRecord(
@@ -230,9 +296,12 @@ class InterviewService:
             # Increment question number
             interview.current_question_num += 1
             questions_remaining -= 1
+            
+            # Start on the question after this one while the candidate answers
+            self._prefetch_next_question(interview)
         
-        # Update storage
-        await self.storage.update(interview)
+        # Persist in the background so storage latency isn't on the response
+        self._schedule_update(interview)
         
         return SubmitAnswerResponse(
             evaluation=evaluation,
@@ -242,10 +311,144 @@ class InterviewService:
             current_question_num=interview.current_question_num,
         )
     
+    async def _get_interview(self, interview_id: UUID) -> InterviewState | None:
+        """Get an interview, preferring a state that is still being written."""
+        interview = self._pending_writes.get(interview_id.int)
+        if interview is not None:
+            return interview
+        return await self.storage.get(interview_id)
+    
+    def _schedule_update(self, interview: InterviewState) -> None:
+        """Queue an interview state to be written to storage."""
+        key = interview.interview_id.int
+        self._pending_writes[key] = interview
+        self._write_versions[key] = self._write_versions.get(key, 0) + 1
+        # A key already queued is written with its latest state
+        if key not in self._queued_writes:
+            self._queued_writes.add(key)
+            self._write_queue.put_nowait(key)
+    
+    async def _run_write_worker(self) -> None:
+        """Write queued interview states to storage until cancelled."""
+        while True:
+            key = await self._write_queue.get()
+            self._queued_writes.discard(key)
+            try:
+                await self._write_pending(key)
+            finally:
+                self._write_queue.task_done()
+    
+    async def _write_pending(self, key: int) -> None:
+        """
+        Persist the pending state for a key, retrying failed writes.
+        
+        The entry is only dropped once the version that was written is still
+        the latest; an update made during the write queues the key again.
+        A state that can't be written stays pending, so reads still see it
+        and its next update retries the write.
+        """
+        delay = WRITE_RETRY_DELAY_SECONDS
+        for attempt in range(1, WRITE_MAX_ATTEMPTS + 1):
+            version = self._write_versions[key]
+            try:
+                await self.storage.update(self._pending_writes[key])
+            except Exception:
+                if attempt == WRITE_MAX_ATTEMPTS:
+                    logger.exception(
+                        "Failed to persist interview state; keeping it in memory"
+                    )
+                    return
+                logger.warning(
+                    "Failed to persist interview state (attempt %d), retrying",
+                    attempt,
+                    exc_info=True,
+                )
+                await asyncio.sleep(delay)
+                delay *= 2
+                continue
+            
+            if self._write_versions.get(key) == version:
+                del self._pending_writes[key]
+                del self._write_versions[key]
+            elif key not in self._queued_writes:
+                # Updated while writing; write the newer state too
+                self._queued_writes.add(key)
+                self._write_queue.put_nowait(key)
+            return
+    
+    def start_write_worker(self) -> None:
+        """Start the background storage writer."""
+        if self._write_worker is None:
+            self._write_worker = asyncio.create_task(self._run_write_worker())
+    
+    async def stop_write_worker(self) -> None:
+        """Flush pending writes, then stop the background storage writer."""
+        if self._write_worker is None:
+            return
+        await self._write_queue.join()
+        self._write_worker.cancel()
+        self._write_worker = None
+    
+    def _get_adaptive_difficulty(self, interview: InterviewState) -> Difficulty:
+        """Calculate the next question's difficulty from the last 3 scores."""
+        return self.openai.calculate_adaptive_difficulty(
+            current_difficulty=interview.config.difficulty,
+            recent_scores=list(interview.recent_scores),
+        )
+    
+    async def _generate_question(
+        self,
+        interview: InterviewState,
+        question_number: int,
+        difficulty: Difficulty,
+    ) -> InterviewQuestion:
+        """Generate a question for the interview using its history so far."""
+        history_summary = interview.running_summary
+        # A prefetch runs while the current question is still unanswered
+        last_record = interview.conversation_history[-1]
+        if last_record.evaluation is None:
+            history_summary += self.openai.format_history_entry(last_record.question, None)
+        
+        return await self.openai.generate_question(
+            experience_years=interview.config.experience_years,
+            subject=interview.config.subject,
+            difficulty=difficulty,
+            question_number=question_number,
+            total_questions=interview.config.num_questions,
+            history_summary=history_summary,
+        )
+    
+    def _prefetch_next_question(self, interview: InterviewState) -> None:
+        """
+        Start generating the question after the current one in the background.
+        
+        The difficulty is predicted from the scores so far; submit_answer
+        discards the result if the pending answer's score changes the tier.
+        The task is kept on the interview state so it isn't garbage collected.
+        """
+        if interview.current_question_num >= interview.config.num_questions:
+            return
+        
+        difficulty = self._get_adaptive_difficulty(interview)
+        task = asyncio.create_task(
+            self._generate_question(
+                interview,
+                question_number=interview.current_question_num + 1,
+                difficulty=difficulty,
+            ),
+            name=f"prefetch-question-{interview.interview_id}",
+        )
+        # Report failures here: a failed prefetch is regenerated inline, so
+        # the error would otherwise never be seen
+        task.add_done_callback(_log_task_failure)
+        interview.pending_next_question = task
+        interview.pending_next_difficulty = difficulty
+    
     async def get_report(
         self,
         interview_id: UUID,
-    ) -> FinalReportResponse:
+        defer: bool = False,
+    ) -> FinalReportResponse | None:
         """
         Generate comprehensive final report.
         
@@ -253,33 +456,42 @@ class InterviewService:
         
         Args:
             interview_id: The interview to generate report for
+            defer: Queue the report for the next Batch API submission
+                instead of generating it now
             
         Returns:
-            Comprehensive assessment report
+            Comprehensive assessment report, or None if it was deferred
             
         Raises:
             InterviewNotFoundError: If interview doesn't exist
             InterviewServiceError: If interview is not completed
         """
         # Retrieve interview state
-        interview = await self.storage.get(interview_id)
+        interview = await self._get_interview(interview_id)
         
         if interview is None:
             raise InterviewNotFoundError(
                 f"Interview {interview_id} not found or expired"
             )
         
-        if interview.status != InterviewStatus.COMPLETED:
+        if interview.status != "completed":
             raise InterviewServiceError(
                 "Cannot generate report for an incomplete interview. "
-                f"Current status: {interview.status.value}"
+                f"Current status: {interview.status}"
             )
         
+        # A deferred batch may already have produced the report
+        if interview.final_report is not None:
+            return interview.final_report
+        
+        if defer:
+            self._queue_report(interview)
+            return None
+        
         # Filter records that have been answered
-        answered_records = [
-            r for r in interview.conversation_history
-            if r.answer is not None and r.evaluation is not None
-        ]
+        answered_records, question_breakdown, average_score = (
+            self._summarize_answers(interview)
+        )
         
         # Generate report using OpenAI
         report_data = await self.openai.generate_final_report(
@@ -288,39 +500,238 @@ class InterviewService:
             records=answered_records,
         )
         
-        # Build question-wise breakdown
-        question_breakdown = [
-            QuestionBreakdown(
-                question_number=r.question.question_number,
-                question=r.question.question,
-                topic=r.question.topic,
-                difficulty=r.question.difficulty,
-                answer_summary=r.answer[:200] + "..." if len(r.answer) > 200 else r.answer,
-                score=r.evaluation.score,
-                feedback=r.evaluation.feedback,
+        return self._build_report(interview, report_data, question_breakdown, average_score)
+    
+    def _summarize_answers(
+        self,
+        interview: InterviewState,
+    ) -> tuple[list[QuestionAnswerRecord], list[QuestionBreakdown], float]:
+        """
+        Collect everything the report needs from the answered questions.
+        
+        Returns:
+            The answered records, their question-wise breakdown and the
+            average score, all built in a single pass over the history
+        """
+        answered_records = []
+        question_breakdown = []
+        score_sum = 0
+        for r in interview.conversation_history:
+            e = r.evaluation
+            if r.answer is None or e is None:
+                continue
+            q = r.question
+            score = e.score
+            answered_records.append(r)
+            question_breakdown.append(QuestionBreakdown.model_construct(
+                question_number=q.question_number,
+                question=q.question,
+                topic=q.topic,
+                difficulty=q.difficulty,
+                answer_summary=r.answer_summary,
+                score=score,
+                feedback=e.feedback,
+            ))
+            score_sum += score
+        
+        average_score = score_sum / len(answered_records) if answered_records else 0
+        return answered_records, question_breakdown, average_score
+    
+    def _build_report(
+        self,
+        interview: InterviewState,
+        report_data: dict,
+        question_breakdown: list[QuestionBreakdown],
+        average_score: float,
+    ) -> FinalReportResponse:
+        """Combine the LLM report data with the per-question breakdown."""
+        config = interview.config
+        
+        # Built without validation: the LLM fields are coerced to the types
+        # and ranges validation would enforce, the rest is validated state
+        return FinalReportResponse.model_construct(
+            interview_id=interview.interview_id,
+            total_questions=config.num_questions,
+            questions_answered=len(question_breakdown),
+            experience_years=config.experience_years,
+            subject=config.subject,
+            question_wise_breakdown=tuple(question_breakdown),
+            **{
+                key: self._coerce_report_field(key, report_data.get(key), average_score)
+                for key in _REPORT_LLM_FIELDS
+            },
+        )
+    
+    @staticmethod
+    def _coerce_report_field(key: str, value: Any, average_score: float) -> Any:
+        """Coerce one LLM report field to the type the report model expects."""
+        if key == "overall_score":
+            # Fall back to the average score if OpenAI's is missing or invalid
+            return coerce_score(value, average_score, 0.0, 10.0)
+        if key in _REPORT_LIST_FIELDS:
+            return coerce_str_list(value)
+        if key == "hire_recommendation":
+            return coerce_text(value, "Unable to determine")
+        return coerce_text(value)
+    
+    async def stream_report(
+        self,
+        interview_id: UUID,
+    ) -> AsyncIterator[tuple[str, Any]]:
+        """
+        Generate the final report as a stream of fields.
+        
+        Fields known without the LLM (config, question breakdown) are
+        yielded first, then each LLM field as soon as it has been generated.
+        The assembled report is kept on the interview so later report
+        requests don't call the LLM again.
+        
+        Args:
+            interview_id: The interview to generate report for
+            
+        Returns:
+            Async iterator of (field name, value) pairs
+            
+        Raises:
+            InterviewNotFoundError: If interview doesn't exist
+            InterviewServiceError: If interview is not completed
+        """
+        interview = await self._get_interview(interview_id)
+        
+        if interview is None:
+            raise InterviewNotFoundError(
+                f"Interview {interview_id} not found or expired"
             )
-            for r in answered_records
-        ]
         
-        # Calculate overall score if not provided by OpenAI
-        if "overall_score" not in report_data:
-            scores = [r.evaluation.score for r in answered_records]
-            report_data["overall_score"] = sum(scores) / len(scores) if scores else 0
+        if interview.status != "completed":
+            raise InterviewServiceError(
+                "Cannot generate report for an incomplete interview. "
+                f"Current status: {interview.status}"
+            )
         
-        return FinalReportResponse(
-            interview_id=interview_id,
-            overall_score=report_data.get("overall_score", 0),
-            total_questions=interview.config.num_questions,
-            questions_answered=len(answered_records),
+        # Validated up front so errors surface before the response starts
+        return self._stream_report_fields(interview)
+    
+    async def _stream_report_fields(
+        self,
+        interview: InterviewState,
+    ) -> AsyncIterator[tuple[str, Any]]:
+        """Yield the report fields for a completed interview."""
+        if interview.final_report is not None:
+            for field in interview.final_report.model_dump().items():
+                yield field
+            return
+        
+        answered_records, question_breakdown, average_score = (
+            self._summarize_answers(interview)
+        )
+        
+        yield "interview_id", interview.interview_id
+        yield "total_questions", interview.config.num_questions
+        yield "questions_answered", len(answered_records)
+        yield "experience_years", interview.config.experience_years
+        yield "subject", interview.config.subject
+        yield "question_wise_breakdown", [b.model_dump() for b in question_breakdown]
+        
+        # The LLM's output can be steered by the candidate's answers: forward
+        # only the known fields, once each, coerced exactly as they will be
+        # stored in the final report
+        report_data: dict[str, Any] = {}
+        async for key, value in self.openai.generate_final_report_stream(
             experience_years=interview.config.experience_years,
             subject=interview.config.subject,
-            detailed_feedback=report_data.get("detailed_feedback", ""),
-            strong_areas=report_data.get("strong_areas", []),
-            weak_areas=report_data.get("weak_areas", []),
-            question_wise_breakdown=question_breakdown,
-            recommendations=report_data.get("recommendations", []),
-            hire_recommendation=report_data.get("hire_recommendation", "Unable to determine"),
+            records=answered_records,
+        ):
+            if key not in _REPORT_LLM_FIELDS or key in report_data:
+                continue
+            report_data[key] = value
+            yield key, self._coerce_report_field(key, value, average_score)
+        
+        interview.final_report = self._build_report(
+            interview, report_data, question_breakdown, average_score
         )
+        self._schedule_update(interview)
+        
+        # Fill in anything the LLM left out
+        for key, value in interview.final_report.model_dump(
+            include=set(_REPORT_LLM_FIELDS),
+        ).items():
+            if key not in report_data:
+                yield key, value
+    
+    def _queue_report(self, interview: InterviewState) -> None:
+        """
+        Add an interview to the pending report batch.
+        
+        The first report queued starts a timer; everything queued before it
+        fires is submitted as a single Batch API job. Interviews already in
+        a running batch are not queued again, so clients can poll with
+        defer=true without submitting a new job each time.
+        """
+        key = interview.interview_id.int
+        if key in self._in_flight_reports:
+            return
+        self._pending_reports[key] = interview
+        if self._report_batch_task is None:
+            task = asyncio.create_task(self._submit_report_batch())
+            self._report_batch_tasks.add(task)
+            task.add_done_callback(self._report_batch_tasks.discard)
+            task.add_done_callback(_log_task_failure)
+            self._report_batch_task = task
+    
+    async def _submit_report_batch(self) -> None:
+        """Submit the pending reports and store the results on each interview."""
+        await asyncio.sleep(settings.report_batch_window_seconds)
+        
+        keys = list(self._pending_reports)
+        interviews = list(self._pending_reports.values())
+        self._pending_reports.clear()
+        self._report_batch_task = None
+        self._in_flight_reports.update(keys)
+        
+        try:
+            summaries = [self._summarize_answers(i) for i in interviews]
+            results = await self.openai.generate_final_reports_batch([
+                (i.config.experience_years, i.config.subject, answered_records)
+                for i, (answered_records, _, _) in zip(interviews, summaries)
+            ])
+            
+            # Failed requests are left unset; the client can still ask inline
+            for interview, summary, report_data in zip(interviews, summaries, results):
+                if report_data is None:
+                    continue
+                _, question_breakdown, average_score = summary
+                interview.final_report = self._build_report(
+                    interview, report_data, question_breakdown, average_score
+                )
+                self._schedule_update(interview)
+        finally:
+            self._in_flight_reports.difference_update(keys)
+    
+    def stop_report_batches(self) -> None:
+        """Cancel report batches that are waiting or still running."""
+        for task in list(self._report_batch_tasks):
+            task.cancel()
+        self._report_batch_task = None
+    
+    async def evaluate_answers_bulk(
+        self,
+        request: BulkEvaluateRequest,
+    ) -> BulkEvaluateResponse:
+        """
+        Evaluate many answers concurrently, outside of any interview session.
+        
+        Args:
+            request: Questions and answers to evaluate
+            
+        Returns:
+            Evaluations in the same order as the request items
+        """
+        evaluations = await self.openai.evaluate_answers_bulk([
+            (item.question, item.answer, item.experience_years, item.subject)
+            for item in request.items
+        ])
+        return BulkEvaluateResponse(evaluations=evaluations)
     
     async def get_interview_state(
         self,
@@ -338,7 +749,7 @@ class InterviewService:
         Raises:
             InterviewNotFoundError: If interview doesn't exist
         """
-        interview = await self.storage.get(interview_id)
+        interview = await self._get_interview(interview_id)
         
         if interview is None:
             raise InterviewNotFoundError(
@@ -365,7 +776,7 @@ class InterviewService:
         """
         interview = await self.get_interview_state(interview_id)
         
-        if interview.status == InterviewStatus.COMPLETED:
+        if interview.status == "completed":
             return None
         
         # Return the last question in history (should be unanswered)
@@ -375,8 +786,7 @@ class InterviewService:
         return None
 
 
-# Service factory function
-def get_interview_service() -> InterviewService:
-    """Get an interview service instance."""
-    return InterviewService()
-
+# Service dependency
+def get_interview_service(request: Request) -> InterviewService:
+    """Get the application's interview service, created in the app lifespan."""
+    return request.app.state.interview_service
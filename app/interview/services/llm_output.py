@@ -0,0 +1,35 @@
+"""
+Coercion of parsed LLM JSON into the types response models expect.
+
+Models built from LLM output use model_construct and skip validation, so
+malformed values are coerced here instead: wrong types fall back to a
+default rather than raising or corrupting the model.
+"""
+from typing import Any
+
+
+def coerce_score(value: Any, default: float, low: float, high: float) -> float:
+    """Convert a score to a float clamped to [low, high], or the default."""
+    if isinstance(value, bool):
+        return default
+    try:
+        score = float(value)
+    except (TypeError, ValueError):
+        return default
+    if score != score:  # NaN
+        return default
+    return min(max(score, low), high)
+
+
+def coerce_text(value: Any, default: str = "") -> str:
+    """Convert a text field to str; a missing value becomes the default."""
+    if value is None:
+        return default
+    return value if isinstance(value, str) else str(value)
+
+
+def coerce_str_list(value: Any) -> tuple[str, ...]:
+    """Convert a list field to a tuple of strings; non-lists become ()."""
+    if not isinstance(value, list):
+        return ()
+    return tuple(coerce_text(item) for item in value)
@@ -7,139 +7,58 @@ Handles all interactions with the OpenAI API including:
 - Final report generation
 - Speech-to-text transcription
 """
+import asyncio
 import json
-from typing import Any, BinaryIO
+from functools import lru_cache
+from typing import Any, AsyncIterator, BinaryIO, get_args
 
+import httpx
+import orjson
+from fastapi import Request
 from openai import AsyncOpenAI
 
+# Optional HTTP/2 support (requires the h2 package)
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
 from app.core.config import settings
 from app.interview.models import (
     Difficulty,
     InterviewQuestion,
     QuestionAnswerRecord,
     QuestionEvaluation,
+    format_history_entry,
 )
+from app.interview.services.llm_output import coerce_score, coerce_str_list, coerce_text
+from app.interview.services.semantic_cache import SemanticCache
 
+_json_decoder = json.JSONDecoder()
 
-class OpenAIService:
-    """
-    Async service for OpenAI API interactions.
-    
-    Uses gpt-4o-mini for cost efficiency and speed.
-    All methods are async for better performance.
-    """
-    
-    def __init__(self):
-        """Initialize the OpenAI client."""
-        self.client = AsyncOpenAI(api_key=settings.openai_api_key)
-        self.model = settings.openai_model
-    
-    async def _chat_completion(
-        self,
-        system_prompt: str,
-        user_prompt: str,
-        temperature: float = 0.7,
-        max_tokens: int = 2000,
-    ) -> str:
-        """
-        Make an async chat completion request.
-        
-        Args:
-            system_prompt: The system message
-            user_prompt: The user message
-            temperature: Creativity parameter (0-1)
-            max_tokens: Maximum response length
-            
-        Returns:
-            The assistant's response text
-        """
-        response = await self.client.chat.completions.create(
-            model=self.model,
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_prompt},
-            ],
-            temperature=temperature,
-            max_tokens=max_tokens,
-        )
-        return response.choices[0].message.content or ""
-    
-    async def _chat_completion_json(
-        self,
-        system_prompt: str,
-        user_prompt: str,
-        temperature: float = 0.7,
-        max_tokens: int = 2000,
-    ) -> dict[str, Any]:
-        """
-        Make a chat completion request expecting JSON response.
-        
-        Args:
-            system_prompt: The system message
-            user_prompt: The user message
-            temperature: Creativity parameter (0-1)
-            max_tokens: Maximum response length
-            
-        Returns:
-            Parsed JSON response as dictionary
-        """
-        response = await self.client.chat.completions.create(
-            model=self.model,
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_prompt},
-            ],
-            temperature=temperature,
-            max_tokens=max_tokens,
-            response_format={"type": "json_object"},
-        )
-        content = response.choices[0].message.content or "{}"
-        return json.loads(content)
-    
-    def _get_experience_description(self, years: int) -> str:
-        """Convert years of experience to descriptive level."""
-        if years == 0:
-            return "Fresher (0 years) - Entry level, focus on fundamentals and basic concepts"
-        elif years <= 2:
-            return f"Junior ({years} years) - Focus on fundamentals, basic concepts, definitions"
-        elif years <= 5:
-            return f"Mid-level ({years} years) - Include design decisions, trade-offs, best practices"
-        else:
-            return f"Senior ({years} years) - Focus on architecture, system design, leadership scenarios"
-    
-    def _get_question_generation_system_prompt(
-        self,
-        experience_years: int,
-        subject: str,
-        difficulty: Difficulty,
-        question_number: int,
-        total_questions: int,
-        previous_records: list[QuestionAnswerRecord] | None = None,
-    ) -> str:
-        """Generate system prompt for question generation."""
-        
-        experience_desc = self._get_experience_description(experience_years)
-        
-        history_context = ""
-        if previous_records:
-            history_context = "\n\nPrevious questions and performance:\n"
-            for record in previous_records:
-                q = record.question
-                eval_info = ""
-                if record.evaluation:
-                    eval_info = f" (Score: {record.evaluation.score}/10)"
-                history_context += f"- Q{q.question_number} [{q.difficulty.value}]: {q.question[:100]}...{eval_info}\n"
-        
-        return f"""You are an expert technical interviewer conducting a {subject} interview.
+# Difficulty levels in ascending order (as declared), and each level's position
+_DIFFICULTY_SEQ: tuple[Difficulty, ...] = get_args(Difficulty)
+_DIFFICULTY_INDEX: dict[Difficulty, int] = {d: i for i, d in enumerate(_DIFFICULTY_SEQ)}
+
+# ============================================================================
+# Prompt Templates
+# ============================================================================
+# Constant prompt text, filled in with str.format_map by the prompt builders.
+# The question prompt is split around the per-call question history.
+
+# Question generation, before the question history
+_QUESTION_HEADER_TMPL = """You are an expert technical interviewer conducting a {subject} interview.
 
 CANDIDATE PROFILE:
 - Experience: {experience_desc}
 - Years of Experience: {experience_years}
 - Subject: {subject}
-- Current Difficulty: {difficulty.value}
-- Question: {question_number} of {total_questions}
-{history_context}
+- Current Difficulty: {difficulty}
+- Question: {question_number} of {total_questions}"""
 
+# Question generation, after the question history
+_QUESTION_FOOTER_TMPL = """
 CRITICAL RULES:
 - Generate ONLY THEORETICAL/CONCEPTUAL questions
 - DO NOT ask coding questions, algorithm implementation, or "write code" questions
@@ -176,21 +95,13 @@ RESPONSE FORMAT (JSON):
 {{
     "question": "The THEORETICAL interview question text",
     "topic": "Specific topic within {subject}",
-    "difficulty": "{difficulty.value}"
+    "difficulty": "{difficulty}"
 }}
 
 Generate only the JSON response, no additional text."""
 
-    def _get_evaluation_system_prompt(
-        self,
-        experience_years: int,
-        subject: str,
-    ) -> str:
-        """Generate system prompt for answer evaluation."""
-        
-        experience_desc = self._get_experience_description(experience_years)
-        
-        return f"""You are an expert technical interviewer evaluating a candidate's answer.
+# Answer evaluation
+_EVALUATION_TMPL = """You are an expert technical interviewer evaluating a candidate's answer.
 
 EVALUATION CONTEXT:
 - Candidate Experience: {experience_desc}
@@ -227,16 +138,8 @@ RESPONSE FORMAT (JSON):
 
 Generate only the JSON response, no additional text."""
 
-    def _get_final_report_system_prompt(
-        self,
-        experience_years: int,
-        subject: str,
-    ) -> str:
-        """Generate system prompt for final report generation."""
-        
-        experience_desc = self._get_experience_description(experience_years)
-        
-        return f"""You are an expert technical interviewer generating a comprehensive assessment report.
+# Final report generation
+_REPORT_TMPL = """You are an expert technical interviewer generating a comprehensive assessment report.
 
 ASSESSMENT CONTEXT:
 - Candidate Experience: {experience_desc}
@@ -269,6 +172,362 @@ RESPONSE FORMAT (JSON):
 
 Generate only the JSON response, no additional text."""
 
+
+class _JSONFieldParser:
+    """
+    Incremental parser for the top-level fields of a streamed JSON object.
+    
+    Text is fed in as it arrives; each (key, value) pair is returned once
+    its value is complete. A value is only accepted once the following
+    "," or "}" has arrived, so a number like 7.5 isn't cut off at 7.
+    """
+    
+    def __init__(self):
+        self._buffer = ""
+        self._pos = 0
+        self._started = False
+    
+    def feed(self, text: str) -> list[tuple[str, Any]]:
+        """Add streamed text and return any fields completed by it."""
+        self._buffer += text
+        fields = []
+        while (field := self._next_field()) is not None:
+            fields.append(field)
+        return fields
+    
+    def _skip(self, pos: int, chars: str) -> int:
+        """Skip whitespace and any of the given delimiter characters."""
+        while pos < len(self._buffer) and (
+            self._buffer[pos].isspace() or self._buffer[pos] in chars
+        ):
+            pos += 1
+        return pos
+    
+    def _next_field(self) -> tuple[str, Any] | None:
+        pos = self._skip(self._pos, "{" if not self._started else ",")
+        try:
+            key, pos = _json_decoder.raw_decode(self._buffer, pos)
+            pos = self._skip(pos, ":")
+            value, end = _json_decoder.raw_decode(self._buffer, pos)
+        except json.JSONDecodeError:
+            return None
+        delimiter = self._skip(end, "")
+        if delimiter >= len(self._buffer) or self._buffer[delimiter] not in ",}":
+            return None
+        self._started = True
+        self._pos = end
+        return key, value
+
+
+class OpenAIService:
+    """
+    Async service for OpenAI API interactions.
+    
+    Uses gpt-4o-mini for cost efficiency and speed.
+    All methods are async for better performance.
+    """
+    
+    def __init__(self):
+        """Initialize the OpenAI client with a tuned, shared connection pool."""
+        http_client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=settings.openai_max_connections,
+                max_keepalive_connections=settings.openai_max_keepalive,
+                keepalive_expiry=30,
+            ),
+            timeout=httpx.Timeout(connect=5, read=120, write=30, pool=10),
+            http2=HTTP2_AVAILABLE,
+        )
+        # The SDK retries rate limits, timeouts and connection errors with
+        # jittered exponential backoff, honouring Retry-After when sent
+        self.client = AsyncOpenAI(
+            api_key=settings.openai_api_key,
+            http_client=http_client,
+            max_retries=settings.openai_max_retries,
+        )
+        self.model = settings.openai_model
+        # Caps in-flight chat completions so bursts don't trip rate limits
+        self._llm_semaphore = asyncio.Semaphore(settings.openai_max_concurrency)
+        
+        # Semantic caches for near-duplicate prompts (disabled by default)
+        self.question_cache: SemanticCache | None = None
+        self.evaluation_cache: SemanticCache | None = None
+        if settings.semantic_cache_enabled:
+            self.question_cache = SemanticCache(
+                embed=self._embed,
+                threshold=settings.semantic_cache_question_threshold,
+                max_entries=settings.semantic_cache_max_entries,
+            )
+            self.evaluation_cache = SemanticCache(
+                embed=self._embed,
+                threshold=settings.semantic_cache_evaluation_threshold,
+                max_entries=settings.semantic_cache_max_entries,
+            )
+    
+    async def close(self) -> None:
+        """Close the underlying HTTP connection pool."""
+        await self.client.close()
+    
+    async def _chat_completion(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        temperature: float = 0.7,
+        max_tokens: int = 2000,
+    ) -> str:
+        """
+        Make an async chat completion request.
+        
+        Args:
+            system_prompt: The system message
+            user_prompt: The user message
+            temperature: Creativity parameter (0-1)
+            max_tokens: Maximum response length
+            
+        Returns:
+            The assistant's response text
+        """
+        async with self._llm_semaphore:
+            response = await self.client.chat.completions.create(
+                model=self.model,
+                messages=[
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": user_prompt},
+                ],
+                temperature=temperature,
+                max_tokens=max_tokens,
+            )
+        return response.choices[0].message.content or ""
+    
+    async def _chat_completion_json(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        temperature: float = 0.7,
+        max_tokens: int = 2000,
+    ) -> dict[str, Any]:
+        """
+        Make a chat completion request expecting JSON response.
+        
+        Args:
+            system_prompt: The system message
+            user_prompt: The user message
+            temperature: Creativity parameter (0-1)
+            max_tokens: Maximum response length
+            
+        Returns:
+            Parsed JSON response as dictionary
+        """
+        async with self._llm_semaphore:
+            response = await self.client.chat.completions.create(
+                model=self.model,
+                messages=[
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": user_prompt},
+                ],
+                temperature=temperature,
+                max_tokens=max_tokens,
+                response_format={"type": "json_object"},
+            )
+        content = response.choices[0].message.content or "{}"
+        return orjson.loads(content)
+    
+    async def _chat_completion_json_stream(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        temperature: float = 0.7,
+        max_tokens: int = 2000,
+    ) -> AsyncIterator[tuple[str, Any]]:
+        """
+        Stream a JSON chat completion, yielding top-level fields as they complete.
+        
+        Args:
+            system_prompt: The system message
+            user_prompt: The user message
+            temperature: Creativity parameter (0-1)
+            max_tokens: Maximum response length
+            
+        Yields:
+            (key, value) pairs of the response object, in generation order
+        """
+        async with self._llm_semaphore:
+            response = await self.client.chat.completions.create(
+                model=self.model,
+                messages=[
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": user_prompt},
+                ],
+                temperature=temperature,
+                max_tokens=max_tokens,
+                response_format={"type": "json_object"},
+                stream=True,
+            )
+            parser = _JSONFieldParser()
+            async for chunk in response:
+                if not chunk.choices or not chunk.choices[0].delta.content:
+                    continue
+                for field in parser.feed(chunk.choices[0].delta.content):
+                    yield field
+    
+    async def _embed(self, text: str) -> list[float]:
+        """Get the embedding vector for a text."""
+        response = await self.client.embeddings.create(
+            model=settings.semantic_cache_embedding_model,
+            input=text,
+        )
+        return response.data[0].embedding
+    
+    async def _cached_chat_completion_json(
+        self,
+        cache: SemanticCache | None,
+        cache_key: str,
+        system_prompt: str,
+        user_prompt: str,
+        temperature: float = 0.7,
+        max_tokens: int = 2000,
+    ) -> dict[str, Any]:
+        """
+        Make a JSON chat completion request through a semantic cache.
+        
+        Args:
+            cache: Cache to consult, or None to always call the API
+            cache_key: Canonical text describing the request
+            system_prompt: The system message
+            user_prompt: The user message
+            temperature: Creativity parameter (0-1)
+            max_tokens: Maximum response length
+            
+        Returns:
+            Parsed JSON response as dictionary
+        """
+        async def create() -> dict[str, Any]:
+            return await self._chat_completion_json(
+                system_prompt=system_prompt,
+                user_prompt=user_prompt,
+                temperature=temperature,
+                max_tokens=max_tokens,
+            )
+        
+        if cache is None:
+            return await create()
+        return await cache.get_or_create(cache_key, create)
+    
+    def _get_experience_bucket(self, years: int) -> str:
+        """Convert years of experience to a coarse level for cache keys."""
+        if years == 0:
+            return "fresher"
+        elif years <= 2:
+            return "junior"
+        elif years <= 5:
+            return "mid"
+        else:
+            return "senior"
+    
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _get_experience_description(years: int) -> str:
+        """Convert years of experience to descriptive level."""
+        if years == 0:
+            return "Fresher (0 years) - Entry level, focus on fundamentals and basic concepts"
+        elif years <= 2:
+            return f"Junior ({years} years) - Focus on fundamentals, basic concepts, definitions"
+        elif years <= 5:
+            return f"Mid-level ({years} years) - Include design decisions, trade-offs, best practices"
+        else:
+            return f"Senior ({years} years) - Focus on architecture, system design, leadership scenarios"
+    
+    def _get_question_generation_system_prompt(
+        self,
+        experience_years: int,
+        subject: str,
+        difficulty: Difficulty,
+        question_number: int,
+        total_questions: int,
+        history_summary: str = "",
+    ) -> str:
+        """Generate system prompt for question generation."""
+        
+        header, footer = self._get_question_generation_prompt_parts(
+            experience_years, subject, difficulty, question_number, total_questions
+        )
+        
+        if not history_summary:
+            return header + "\n\n" + footer
+        
+        # The history is unique per call, so only the surrounding text is cached
+        return (
+            header + "\n\n\nPrevious questions and performance:\n"
+            + history_summary + "\n" + footer
+        )
+    
+    @staticmethod
+    def format_history_entry(question: InterviewQuestion, score: int | None) -> str:
+        """
+        Format one question for the history section of the question prompt.
+        
+        Shared with InterviewState, which rebuilds its running summary from
+        the conversation history when a state is loaded.
+        """
+        return format_history_entry(question, score)
+    
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _get_question_generation_prompt_parts(
+        experience_years: int,
+        subject: str,
+        difficulty: Difficulty,
+        question_number: int,
+        total_questions: int,
+    ) -> tuple[str, str]:
+        """Build the static text before and after the question history."""
+        
+        fields = {
+            "experience_desc": OpenAIService._get_experience_description(experience_years),
+            "experience_years": experience_years,
+            "subject": subject,
+            "difficulty": difficulty,
+            "question_number": question_number,
+            "total_questions": total_questions,
+        }
+        
+        return (
+            _QUESTION_HEADER_TMPL.format_map(fields),
+            _QUESTION_FOOTER_TMPL.format_map(fields),
+        )
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _get_evaluation_system_prompt(
+        experience_years: int,
+        subject: str,
+    ) -> str:
+        """Generate system prompt for answer evaluation."""
+        
+        experience_desc = OpenAIService._get_experience_description(experience_years)
+        
+        return _EVALUATION_TMPL.format_map({
+            "experience_desc": experience_desc,
+            "experience_years": experience_years,
+            "subject": subject,
+        })
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _get_final_report_system_prompt(
+        experience_years: int,
+        subject: str,
+    ) -> str:
+        """Generate system prompt for final report generation."""
+        
+        experience_desc = OpenAIService._get_experience_description(experience_years)
+        
+        return _REPORT_TMPL.format_map({
+            "experience_desc": experience_desc,
+            "experience_years": experience_years,
+            "subject": subject,
+        })
+
     async def generate_question(
         self,
         experience_years: int,
@@ -276,7 +535,7 @@ Generate only the JSON response, no additional text."""
         difficulty: Difficulty,
         question_number: int,
         total_questions: int,
-        previous_records: list[QuestionAnswerRecord] | None = None,
+        history_summary: str = "",
     ) -> InterviewQuestion:
         """
         Generate an interview question based on context.
@@ -287,7 +546,8 @@ Generate only the JSON response, no additional text."""
             difficulty: Target difficulty level
             question_number: Current question number
             total_questions: Total questions in interview
-            previous_records: Previous Q&A records for adaptive questioning
+            history_summary: Previous questions and scores, one
+                format_history_entry line each, for adaptive questioning
             
         Returns:
             Generated interview question
@@ -298,21 +558,31 @@ Generate only the JSON response, no additional text."""
             difficulty=difficulty,
             question_number=question_number,
             total_questions=total_questions,
-            previous_records=previous_records,
+            history_summary=history_summary,
         )
         
         user_prompt = f"Generate question {question_number} of {total_questions} for this {subject} interview."
         
-        response = await self._chat_completion_json(
+        cache_key = (
+            f"{subject}|{self._get_experience_bucket(experience_years)}|{difficulty}"
+            f"|q{question_number}|history={history_summary}"
+        )
+        
+        response = await self._cached_chat_completion_json(
+            cache=self.question_cache,
+            cache_key=cache_key,
             system_prompt=system_prompt,
             user_prompt=user_prompt,
             temperature=0.8,  # Slightly higher for variety
         )
         
-        return InterviewQuestion(
+        # Built without validation; the only field the model could get wrong
+        # is difficulty, so fall back to the requested one
+        response_difficulty = response.get("difficulty")
+        return InterviewQuestion.model_construct(
             question_number=question_number,
             question=response.get("question", ""),
-            difficulty=Difficulty(response.get("difficulty", difficulty.value)),
+            difficulty=response_difficulty if response_difficulty in _DIFFICULTY_INDEX else difficulty,
             topic=response.get("topic", subject),
         )
     
@@ -340,7 +610,7 @@ Generate only the JSON response, no additional text."""
             subject=subject,
         )
         
-        user_prompt = f"""QUESTION ({question.difficulty.value} - {question.topic}):
+        user_prompt = f"""QUESTION ({question.difficulty} - {question.topic}):
 {question.question}
 
 CANDIDATE'S ANSWER:
@@ -348,40 +618,65 @@ CANDIDATE'S ANSWER:
 
 Evaluate this answer."""
         
-        response = await self._chat_completion_json(
+        cache_key = (
+            f"{subject}|{self._get_experience_bucket(experience_years)}"
+            f"|question={question.question}|answer={answer}"
+        )
+        
+        response = await self._cached_chat_completion_json(
+            cache=self.evaluation_cache,
+            cache_key=cache_key,
             system_prompt=system_prompt,
             user_prompt=user_prompt,
             temperature=0.3,  # Lower for consistency
         )
         
-        return QuestionEvaluation(
-            score=response.get("score", 5),
-            correctness=response.get("correctness", ""),
-            depth=response.get("depth", ""),
-            clarity=response.get("clarity", ""),
-            practical_understanding=response.get("practical_understanding", ""),
-            strengths=response.get("strengths", []),
-            areas_for_improvement=response.get("areas_for_improvement", []),
-            feedback=response.get("feedback", ""),
+        # Built without validation; coerce each field to the type and range
+        # validation would have enforced
+        return QuestionEvaluation.model_construct(
+            score=int(coerce_score(response.get("score"), 5, 1, 10)),
+            correctness=coerce_text(response.get("correctness")),
+            depth=coerce_text(response.get("depth")),
+            clarity=coerce_text(response.get("clarity")),
+            practical_understanding=coerce_text(response.get("practical_understanding")),
+            strengths=coerce_str_list(response.get("strengths")),
+            areas_for_improvement=coerce_str_list(response.get("areas_for_improvement")),
+            feedback=coerce_text(response.get("feedback")),
         )
     
-    async def generate_final_report(
+    async def evaluate_answers_bulk(
         self,
-        experience_years: int,
-        subject: str,
-        records: list[QuestionAnswerRecord],
-    ) -> dict[str, Any]:
+        items: list[tuple[InterviewQuestion, str, int, str]],
+    ) -> list[QuestionEvaluation]:
         """
-        Generate a comprehensive final report.
+        Evaluate many answers concurrently.
+        
+        The requests share the connection pool and concurrency limit with
+        all other calls, so large batches queue rather than flood the API.
         
         Args:
-            experience_years: Candidate's years of experience
-            subject: Interview subject
-            records: All Q&A records with evaluations
+            items: (question, answer, experience_years, subject) for each answer
             
         Returns:
-            Final report data dictionary
+            Evaluations in the same order as the items
         """
+        return await asyncio.gather(*[
+            self.evaluate_answer(
+                question=question,
+                answer=answer,
+                experience_years=experience_years,
+                subject=subject,
+            )
+            for question, answer, experience_years, subject in items
+        ])
+    
+    def _get_final_report_prompts(
+        self,
+        experience_years: int,
+        subject: str,
+        records: list[QuestionAnswerRecord],
+    ) -> tuple[str, str]:
+        """Build the system and user prompts for a final report."""
         system_prompt = self._get_final_report_system_prompt(
             experience_years=experience_years,
             subject=subject,
@@ -390,9 +685,9 @@ Evaluate this answer."""
         # Build detailed context of all Q&A
         qa_summary = "\n".join([
             f"""
-Q{r.question.question_number} [{r.question.difficulty.value}] - {r.question.topic}:
+Q{r.question.question_number} [{r.question.difficulty}] - {r.question.topic}:
 Question: {r.question.question}
-Answer: {r.answer[:500] if r.answer else 'No answer'}{'...' if r.answer and len(r.answer) > 500 else ''}
+Answer: {r.report_excerpt}
 Score: {r.evaluation.score if r.evaluation else 'N/A'}/10
 Feedback: {r.evaluation.feedback if r.evaluation else 'N/A'}
 """
@@ -408,6 +703,31 @@ DETAILED Q&A:
 
 Generate the final assessment report."""
         
+        return system_prompt, user_prompt
+    
+    async def generate_final_report(
+        self,
+        experience_years: int,
+        subject: str,
+        records: list[QuestionAnswerRecord],
+    ) -> dict[str, Any]:
+        """
+        Generate a comprehensive final report.
+        
+        Args:
+            experience_years: Candidate's years of experience
+            subject: Interview subject
+            records: All Q&A records with evaluations
+            
+        Returns:
+            Final report data dictionary
+        """
+        system_prompt, user_prompt = self._get_final_report_prompts(
+            experience_years=experience_years,
+            subject=subject,
+            records=records,
+        )
+        
         response = await self._chat_completion_json(
             system_prompt=system_prompt,
             user_prompt=user_prompt,
@@ -417,6 +737,123 @@ Generate the final assessment report."""
         
         return response
     
+    async def generate_final_report_stream(
+        self,
+        experience_years: int,
+        subject: str,
+        records: list[QuestionAnswerRecord],
+    ) -> AsyncIterator[tuple[str, Any]]:
+        """
+        Generate a final report, yielding each field as soon as it is generated.
+        
+        Args:
+            experience_years: Candidate's years of experience
+            subject: Interview subject
+            records: All Q&A records with evaluations
+            
+        Yields:
+            (field name, value) pairs of the final report data
+        """
+        system_prompt, user_prompt = self._get_final_report_prompts(
+            experience_years=experience_years,
+            subject=subject,
+            records=records,
+        )
+        
+        async for field in self._chat_completion_json_stream(
+            system_prompt=system_prompt,
+            user_prompt=user_prompt,
+            temperature=0.4,
+            max_tokens=3000,
+        ):
+            yield field
+    
+    async def generate_final_reports_batch(
+        self,
+        reports: list[tuple[int, str, list[QuestionAnswerRecord]]],
+    ) -> list[dict[str, Any] | None]:
+        """
+        Generate several final reports through the OpenAI Batch API.
+        
+        Batch requests cost half as much as synchronous ones but may take
+        up to the 24h completion window, so this is only for reports that
+        are delivered later rather than awaited by a client.
+        
+        Args:
+            reports: (experience_years, subject, records) for each report
+            
+        Returns:
+            Report data for each input, in order; None where a request failed
+        """
+        lines: list[bytes] = []
+        for index, (experience_years, subject, records) in enumerate(reports):
+            system_prompt, user_prompt = self._get_final_report_prompts(
+                experience_years=experience_years,
+                subject=subject,
+                records=records,
+            )
+            lines.append(orjson.dumps({
+                "custom_id": str(index),
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    "model": self.model,
+                    "messages": [
+                        {"role": "system", "content": system_prompt},
+                        {"role": "user", "content": user_prompt},
+                    ],
+                    "temperature": 0.4,
+                    "max_tokens": 3000,
+                    "response_format": {"type": "json_object"},
+                },
+            }))
+        
+        input_file = await self.client.files.create(
+            file=("final_reports.jsonl", b"\n".join(lines)),
+            purpose="batch",
+        )
+        
+        # The pinned SDK predates client.batches, so use the raw endpoints
+        batch = await self.client.post(
+            "/batches",
+            body={
+                "input_file_id": input_file.id,
+                "endpoint": "/v1/chat/completions",
+                "completion_window": "24h",
+            },
+            cast_to=dict[str, Any],
+        )
+        while batch["status"] not in ("completed", "failed", "expired", "cancelled"):
+            await asyncio.sleep(settings.report_batch_poll_seconds)
+            batch = await self.client.get(f"/batches/{batch['id']}", cast_to=dict[str, Any])
+        
+        results: list[dict[str, Any] | None] = [None] * len(reports)
+        if not batch.get("output_file_id"):
+            return results
+        
+        output = await self.client.files.content(batch["output_file_id"])
+        for line in output.content.splitlines():
+            if not line:
+                continue
+            # Each line is checked on its own so one malformed result
+            # doesn't discard the rest of the batch
+            try:
+                item = orjson.loads(line)
+                response = item.get("response") or {}
+                if response.get("status_code") != 200:
+                    continue
+                index = int(item["custom_id"])
+                content = response["body"]["choices"][0]["message"]["content"]
+                if not isinstance(content, str) or not 0 <= index < len(results):
+                    continue
+                report = orjson.loads(content)
+            except (AttributeError, KeyError, IndexError, TypeError, ValueError):
+                continue
+            if isinstance(report, dict):
+                results[index] = report
+        
+        return results
+    
     def calculate_adaptive_difficulty(
         self,
         current_difficulty: Difficulty,
@@ -437,16 +874,15 @@ Generate the final assessment report."""
         
         avg_score = sum(recent_scores) / len(recent_scores)
         
-        difficulty_order = [Difficulty.EASY, Difficulty.MEDIUM, Difficulty.HARD]
-        current_index = difficulty_order.index(current_difficulty)
+        current_index = _DIFFICULTY_INDEX[current_difficulty]
         
         # Adjust based on performance
-        if avg_score >= 8 and current_index < 2:
+        if avg_score >= 8 and current_index < len(_DIFFICULTY_SEQ) - 1:
             # Performing well, increase difficulty
-            return difficulty_order[current_index + 1]
+            return _DIFFICULTY_SEQ[current_index + 1]
         elif avg_score <= 4 and current_index > 0:
             # Struggling, decrease difficulty
-            return difficulty_order[current_index - 1]
+            return _DIFFICULTY_SEQ[current_index - 1]
         
         return current_difficulty
 
@@ -500,14 +936,12 @@ Generate the final assessment report."""
         }
 
 
-# Singleton instance
-_openai_service: OpenAIService | None = None
-
-
-def get_openai_service() -> OpenAIService:
-    """Get or create the OpenAI service singleton."""
-    global _openai_service
-    if _openai_service is None:
-        _openai_service = OpenAIService()
-    return _openai_service
-
+async def get_openai_service(request: Request) -> OpenAIService:
+    """
+    Get the application's OpenAI service.
+    
+    The service and its connection pool are created once in the app
+    lifespan and kept on app.state; use this as a FastAPI dependency.
+    It is async so FastAPI calls it inline rather than in the threadpool.
+    """
+    return request.app.state.openai
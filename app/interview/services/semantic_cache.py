@@ -0,0 +1,116 @@
+"""
+In-memory semantic cache for LLM responses.
+
+Looks up previous responses by embedding similarity so near-duplicate
+prompts (same subject, level, difficulty, ...) across candidates can reuse
+an earlier generation instead of calling the LLM again.
+"""
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable
+
+import numpy as np
+
+EmbedFunction = Callable[[str], Awaitable[list[float]]]
+
+
+class SemanticCache:
+    """
+    Cache keyed by text, matched by cosine similarity of embeddings.
+
+    Features:
+    - Exact-match LRU front cache that skips the embedding call entirely
+    - Brute-force cosine search over a fixed-size ring of embeddings
+    - Oldest entries are overwritten once the cache is full
+    """
+
+    def __init__(
+        self,
+        embed: EmbedFunction,
+        threshold: float = 0.85,
+        max_entries: int = 1024,
+        exact_cache_size: int = 512,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            embed: Async function returning the embedding vector for a text
+            threshold: Minimum cosine similarity for a semantic hit
+            max_entries: Maximum number of embeddings kept for search
+            exact_cache_size: Number of recent keys kept for exact matches
+        """
+        self._embed = embed
+        self._threshold = threshold
+        self._max_entries = max_entries
+        self._exact_cache_size = exact_cache_size
+        self._exact: OrderedDict[str, Any] = OrderedDict()
+        self._vectors: np.ndarray | None = None
+        self._values: list[Any] = []
+        self._next_slot = 0
+
+    async def get_or_create(
+        self,
+        key: str,
+        create: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        """
+        Return the cached value for a similar key, or create and cache it.
+
+        Args:
+            key: Canonical text describing the request
+            create: Coroutine factory producing the value on a cache miss
+
+        Returns:
+            The cached or newly created value
+        """
+        if key in self._exact:
+            self._exact.move_to_end(key)
+            return self._exact[key]
+
+        vector = self._normalize(await self._embed(key))
+
+        value = self._search(vector)
+        if value is None:
+            value = await create()
+            self._store_vector(vector, value)
+
+        self._store_exact(key, value)
+        return value
+
+    def _search(self, vector: np.ndarray) -> Any | None:
+        """Find the most similar cached value above the threshold."""
+        if not self._values:
+            return None
+
+        similarities = self._vectors[: len(self._values)] @ vector
+        best = int(np.argmax(similarities))
+        if similarities[best] >= self._threshold:
+            return self._values[best]
+        return None
+
+    def _store_vector(self, vector: np.ndarray, value: Any) -> None:
+        """Add an embedding to the search ring, overwriting the oldest slot."""
+        if self._vectors is None:
+            self._vectors = np.empty((self._max_entries, vector.shape[0]), dtype=np.float32)
+
+        slot = self._next_slot
+        self._vectors[slot] = vector
+        if slot < len(self._values):
+            self._values[slot] = value
+        else:
+            self._values.append(value)
+        self._next_slot = (slot + 1) % self._max_entries
+
+    def _store_exact(self, key: str, value: Any) -> None:
+        """Remember the value for exact lookups, evicting the oldest key."""
+        self._exact[key] = value
+        self._exact.move_to_end(key)
+        while len(self._exact) > self._exact_cache_size:
+            self._exact.popitem(last=False)
+
+    @staticmethod
+    def _normalize(embedding: list[float]) -> np.ndarray:
+        """Convert to a unit vector so a dot product is cosine similarity."""
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
@@ -5,23 +5,41 @@ Note: This is suitable for development and single-instance deployments.
 For production with multiple instances, migrate to Redis or a database.
 """
 import asyncio
-from datetime import datetime, timedelta
+import heapq
+import logging
+import time
 from typing import Dict
 from uuid import UUID
 
 from app.interview.models import InterviewState
 
+logger = logging.getLogger(__name__)
+
+# Strong references to background tasks; the event loop only keeps weak ones
+_background_tasks: set[asyncio.Task] = set()
+
 
 class InterviewStorage:
     """
-    Thread-safe in-memory storage for interview sessions.
+    Async-safe in-memory storage for interview sessions.
     
     Features:
-    - Async-safe operations with locks
-    - Automatic session cleanup for expired interviews
+    - Lock-free operations: no method awaits while reading or changing the
+      dicts, so each one runs atomically on the event loop
+    - Automatic session cleanup for expired interviews, driven by a
+      min-heap of access times so only expired entries are visited
     - Session timeout configuration
     """
     
+    __slots__ = (
+        "_storage",
+        "_timestamps",
+        "_expiry_heap",
+        "_session_timeout_s",
+        "_cleanup_task",
+        "_snapshot",
+    )
+    
     def __init__(self, session_timeout_minutes: int = 60):
         """
         Initialize the storage.
@@ -29,10 +47,17 @@ class InterviewStorage:
         Args:
             session_timeout_minutes: Minutes after which inactive sessions expire
         """
-        self._storage: Dict[UUID, InterviewState] = {}
-        self._timestamps: Dict[UUID, datetime] = {}
-        self._lock = asyncio.Lock()
-        self._session_timeout = timedelta(minutes=session_timeout_minutes)
+        # Keyed by UUID.int: plain int hashing is cheaper than UUID.__hash__
+        self._storage: Dict[int, InterviewState] = {}
+        # Last access times from time.monotonic(), compared as plain floats
+        self._timestamps: Dict[int, float] = {}
+        # (access time, key) min-heap; entries go stale when a session is
+        # touched or deleted and are skipped or re-pushed during cleanup
+        self._expiry_heap: list[tuple[float, int]] = []
+        self._session_timeout_s = session_timeout_minutes * 60.0
+        self._cleanup_task: asyncio.Task | None = None
+        # Cached list_all() result; reset to None whenever sessions change
+        self._snapshot: tuple[InterviewState, ...] | None = None
     
     async def create(self, interview: InterviewState) -> InterviewState:
         """
@@ -44,10 +69,13 @@ class InterviewStorage:
         Returns:
             The stored interview state
         """
-        async with self._lock:
-            self._storage[interview.interview_id] = interview
-            self._timestamps[interview.interview_id] = datetime.utcnow()
-            return interview
+        key = interview.interview_id.int
+        now = time.monotonic()
+        self._storage[key] = interview
+        self._timestamps[key] = now
+        heapq.heappush(self._expiry_heap, (now, key))
+        self._snapshot = None
+        return interview
     
     async def get(self, interview_id: UUID) -> InterviewState | None:
         """
@@ -59,23 +87,25 @@ class InterviewStorage:
         Returns:
             The interview state if found and not expired, None otherwise
         """
-        async with self._lock:
-            interview = self._storage.get(interview_id)
-            
-            if interview is None:
-                return None
-            
-            # Check if session has expired
-            timestamp = self._timestamps.get(interview_id)
-            if timestamp and datetime.utcnow() - timestamp > self._session_timeout:
-                # Session expired, clean it up
-                del self._storage[interview_id]
-                del self._timestamps[interview_id]
-                return None
-            
-            # Update access timestamp
-            self._timestamps[interview_id] = datetime.utcnow()
-            return interview
+        key = interview_id.int
+        interview = self._storage.get(key)
+        
+        if interview is None:
+            return None
+        
+        # Check if session has expired
+        timestamp = self._timestamps.get(key)
+        now = time.monotonic()
+        if timestamp is not None and now - timestamp > self._session_timeout_s:
+            # Session expired, clean it up
+            del self._storage[key]
+            del self._timestamps[key]
+            self._snapshot = None
+            return None
+        
+        # Update access timestamp
+        self._timestamps[key] = now
+        return interview
     
     async def update(self, interview: InterviewState) -> InterviewState:
         """
@@ -87,10 +117,15 @@ class InterviewStorage:
         Returns:
             The updated interview state
         """
-        async with self._lock:
-            self._storage[interview.interview_id] = interview
-            self._timestamps[interview.interview_id] = datetime.utcnow()
-            return interview
+        key = interview.interview_id.int
+        now = time.monotonic()
+        if key not in self._timestamps:
+            heapq.heappush(self._expiry_heap, (now, key))
+        if self._storage.get(key) is not interview:
+            self._snapshot = None
+        self._storage[key] = interview
+        self._timestamps[key] = now
+        return interview
     
     async def delete(self, interview_id: UUID) -> bool:
         """
@@ -102,12 +137,13 @@ class InterviewStorage:
         Returns:
             True if deleted, False if not found
         """
-        async with self._lock:
-            if interview_id in self._storage:
-                del self._storage[interview_id]
-                del self._timestamps[interview_id]
-                return True
-            return False
+        key = interview_id.int
+        if key in self._storage:
+            del self._storage[key]
+            del self._timestamps[key]
+            self._snapshot = None
+            return True
+        return False
     
     async def exists(self, interview_id: UUID) -> bool:
         """
@@ -119,8 +155,9 @@ class InterviewStorage:
         Returns:
             True if exists and not expired, False otherwise
         """
-        interview = await self.get(interview_id)
-        return interview is not None
+        # Read-only: unlike get(), this doesn't refresh the access time
+        timestamp = self._timestamps.get(interview_id.int)
+        return timestamp is not None and time.monotonic() - timestamp <= self._session_timeout_s
     
     async def cleanup_expired(self) -> int:
         """
@@ -129,19 +166,57 @@ class InterviewStorage:
         Returns:
             Number of sessions removed
         """
-        async with self._lock:
-            now = datetime.utcnow()
-            expired_ids = [
-                interview_id
-                for interview_id, timestamp in self._timestamps.items()
-                if now - timestamp > self._session_timeout
-            ]
-            
-            for interview_id in expired_ids:
-                del self._storage[interview_id]
-                del self._timestamps[interview_id]
-            
-            return len(expired_ids)
+        cutoff = time.monotonic() - self._session_timeout_s
+        heap = self._expiry_heap
+        removed = 0
+        
+        while heap and heap[0][0] < cutoff:
+            timestamp, key = heapq.heappop(heap)
+            current = self._timestamps.get(key)
+            if current is None:
+                # Deleted or already expired through get()
+                continue
+            if current != timestamp:
+                # Accessed since this entry was pushed; track its latest time
+                heapq.heappush(heap, (current, key))
+                continue
+            del self._storage[key]
+            del self._timestamps[key]
+            removed += 1
+        
+        if removed:
+            self._snapshot = None
+        return removed
+    
+    async def _run_cleanup(self, interval_seconds: float) -> None:
+        """Remove expired sessions every interval until cancelled."""
+        while True:
+            await asyncio.sleep(interval_seconds)
+            try:
+                removed = await self.cleanup_expired()
+                if removed:
+                    logger.debug("Removed %d expired interview sessions", removed)
+            except Exception:
+                logger.exception("Failed to clean up expired interview sessions")
+    
+    def start_cleanup_task(self, interval_seconds: float = 60.0) -> None:
+        """
+        Start periodically removing expired sessions in the background.
+        
+        Args:
+            interval_seconds: Seconds between cleanup runs
+        """
+        if self._cleanup_task is None:
+            task = asyncio.create_task(self._run_cleanup(interval_seconds))
+            _background_tasks.add(task)
+            task.add_done_callback(_background_tasks.discard)
+            self._cleanup_task = task
+    
+    def stop_cleanup_task(self) -> None:
+        """Stop the background cleanup task."""
+        if self._cleanup_task is not None:
+            self._cleanup_task.cancel()
+            self._cleanup_task = None
     
     async def get_active_count(self) -> int:
         """
@@ -151,19 +226,22 @@ class InterviewStorage:
             Number of active sessions
         """
         await self.cleanup_expired()
-        async with self._lock:
-            return len(self._storage)
+        return len(self._storage)
     
-    async def list_all(self) -> list[InterviewState]:
+    async def list_all(self) -> tuple[InterviewState, ...]:
         """
         List all active interview sessions.
         
+        The result is cached until a session is added, replaced or removed,
+        so repeated calls don't copy the storage each time.
+        
         Returns:
-            List of all active interview states
+            Tuple of all active interview states
         """
         await self.cleanup_expired()
-        async with self._lock:
-            return list(self._storage.values())
+        if self._snapshot is None:
+            self._snapshot = tuple(self._storage.values())
+        return self._snapshot
 
 
 # Global storage instance
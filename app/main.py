@@ -3,6 +3,8 @@ FastAPI Application Entry Point.
 
 AI Interview System with Authentication
 """
+import asyncio
+import logging
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
@@ -11,26 +13,65 @@ from fastapi.middleware.cors import CORSMiddleware
 from app.auth.router import router as auth_router
 from app.core.config import settings
 from app.core.database import create_db_and_tables
+from app.core.logging import setup_logging, shutdown_logging
+from app.interview.router import interview_service_error_handler
 from app.interview.router import router as interview_router
+from app.interview.services.interview_service import (
+    InterviewService,
+    InterviewServiceError,
+)
+from app.interview.services.openai_service import OpenAIService
 from app.speech.router import router as speech_router
 
+logger = logging.getLogger(__name__)
 
-@asynccontextmanager
-async def lifespan(app: FastAPI):
+async def init_database() -> bool:
     """
-    Application lifespan manager.
+    Create the database tables.
     
-    Startup: Create database tables
-    Shutdown: Cleanup resources if needed
+    Returns:
+        True if the database is ready, False if initialization failed
     """
-    # Startup - gracefully handle database initialization
     try:
         await create_db_and_tables()
     except Exception as e:
         # Log but don't crash - allows serverless deployment without DB
-        print(f"Database initialization skipped: {e}")
+        logger.warning("Database initialization skipped: %s", e)
+        return False
+    return True
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Application lifespan manager.
+    
+    Startup: Configure logging, start creating database tables in the
+    background, create the shared OpenAI and interview services, start the
+    interview state writer and expired session cleanup
+    Shutdown: Cancel pending report batches, flush interview state, stop
+    session cleanup, close the OpenAI connection pool, flush logs
+    """
+    setup_logging()
+    # Startup - create tables without delaying readiness; kept on app.state
+    # so the task isn't garbage-collected, and awaited by database sessions
+    app.state.db_init_task = asyncio.create_task(init_database())
+    # Created exactly once so every request shares one HTTP connection pool
+    openai_service = OpenAIService()
+    interview_service = InterviewService(openai_service=openai_service)
+    app.state.openai = openai_service
+    app.state.interview_service = interview_service
+    interview_service.start_write_worker()
+    interview_service.storage.start_cleanup_task()
     yield
-    # Shutdown (add cleanup logic here if needed)
+    # Shutdown
+    # Batches write through the write-behind queue, so stop them first
+    interview_service.stop_report_batches()
+    await interview_service.stop_write_worker()
+    interview_service.storage.stop_cleanup_task()
+    app.state.db_init_task.cancel()
+    await openai_service.close()
+    shutdown_logging()
 
 
 def create_application() -> FastAPI:
@@ -74,6 +115,9 @@ A FastAPI backend for conducting AI-powered technical interviews.
         allow_headers=["*"],
     )
 
+    # Map interview service errors to HTTP responses
+    app.add_exception_handler(InterviewServiceError, interview_service_error_handler)
+
     # Include routers
     app.include_router(auth_router, prefix="/auth")
     app.include_router(interview_router, prefix="/api")
@@ -98,8 +142,15 @@ async def root():
 @app.get("/health", tags=["health"])
 async def health_check():
     """Detailed health check endpoint."""
+    db_init_task = app.state.db_init_task
+    if not db_init_task.done():
+        database = "initializing"
+    elif not db_init_task.cancelled() and db_init_task.result():
+        database = "connected"
+    else:
+        database = "unavailable"
     return {
         "status": "healthy",
-        "database": "connected",
+        "database": database,
     }
 
@@ -6,13 +6,18 @@ Includes real-time WebSocket streaming using OpenAI Realtime API.
 """
 import asyncio
 import base64
-import json
+import io
+import os
+import re
+import ssl
+from functools import lru_cache
 from pathlib import Path
-from typing import Annotated
+from typing import Annotated, Any, BinaryIO
 
-from fastapi import APIRouter, File, Form, HTTPException, UploadFile, WebSocket, WebSocketDisconnect, status
-from fastapi.responses import HTMLResponse
-from pydantic import BaseModel
+import orjson
+from fastapi import APIRouter, Depends, File, Form, HTTPException, UploadFile, WebSocket, WebSocketDisconnect, status
+from fastapi.responses import HTMLResponse, ORJSONResponse
+from pydantic import BaseModel, ConfigDict
 
 # Optional websockets import (not available on serverless platforms)
 try:
@@ -22,11 +27,14 @@ except ImportError:
     WEBSOCKETS_AVAILABLE = False
 
 from app.core.config import settings
-from app.interview.services.openai_service import get_openai_service
+from app.interview.services.openai_service import OpenAIService, get_openai_service
 
 
 router = APIRouter(prefix="/speech", tags=["speech"])
 
+# Static test page, read once at import and served as pre-encoded bytes
+_TEST_CLIENT_HTML = (Path(__file__).parent / "test_client.html").read_bytes()
+
 
 @router.get(
     "/test",
@@ -36,8 +44,7 @@ router = APIRouter(prefix="/speech", tags=["speech"])
 )
 async def get_test_client():
     """Serve the real-time transcription test client."""
-    html_path = Path(__file__).parent / "test_client.html"
-    return HTMLResponse(content=html_path.read_text())
+    return HTMLResponse(content=_TEST_CLIENT_HTML)
 
 
 # Supported audio formats by Whisper API
@@ -52,15 +59,62 @@ SUPPORTED_FORMATS = {
     "video/webm": [".webm"],
 }
 
-SUPPORTED_EXTENSIONS = {".mp3", ".mp4", ".mpeg", ".mpga", ".m4a", ".wav", ".webm", ".ogg", ".oga"}
+SUPPORTED_EXTENSIONS = frozenset(
+    {".mp3", ".mp4", ".mpeg", ".mpga", ".m4a", ".wav", ".webm", ".ogg", ".oga"}
+)
+_UNSUPPORTED_FORMAT_DETAIL = (
+    f"Unsupported file format. Supported: {', '.join(sorted(SUPPORTED_EXTENSIONS))}"
+)
 
 # Max file size: 25MB (Whisper API limit)
 MAX_FILE_SIZE = 25 * 1024 * 1024
 
+# Uploads are read in chunks so oversized files are rejected early
+UPLOAD_CHUNK_SIZE = 64 * 1024
+_FILE_TOO_LARGE_DETAIL = f"File too large. Maximum size is {MAX_FILE_SIZE // (1024 * 1024)}MB"
+
+
+async def _open_upload(file: UploadFile) -> tuple[BinaryIO, int]:
+    """
+    Get a readable stream over an upload and its size in bytes.
+    
+    Starlette has usually spooled the upload already and knows its size, so
+    the spooled file is passed on as-is instead of being copied. Otherwise
+    the upload is read in chunks, stopping once it exceeds the size limit.
+    
+    Raises:
+        HTTPException: 413 if the upload exceeds MAX_FILE_SIZE
+    """
+    if file.size is not None:
+        if file.size > MAX_FILE_SIZE:
+            raise HTTPException(
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                detail=_FILE_TOO_LARGE_DETAIL,
+            )
+        await file.seek(0)
+        return file.file, file.size
+    
+    # Only reached for UploadFiles built without a size: Starlette's form
+    # parser always records it, so multipart uploads never allocate here
+    # and a pool of reusable buffers would sit idle
+    buffer = io.BytesIO()
+    while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+        buffer.write(chunk)
+        if buffer.tell() > MAX_FILE_SIZE:
+            raise HTTPException(
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                detail=_FILE_TOO_LARGE_DETAIL,
+            )
+    size = buffer.tell()
+    buffer.seek(0)
+    return buffer, size
+
 
 class TranscriptionResponse(BaseModel):
     """Response model for audio transcription."""
     
+    model_config = ConfigDict(frozen=True)
+    
     text: str
     language: str | None = None
     duration: float | None = None
@@ -70,6 +124,8 @@ class TranscriptionResponse(BaseModel):
 class TranscriptionError(BaseModel):
     """Error response model."""
     
+    model_config = ConfigDict(frozen=True)
+    
     detail: str
 
 
@@ -112,7 +168,8 @@ async def transcribe_audio(
         str | None,
         Form(description="Optional prompt to guide transcription style or provide context"),
     ] = None,
-) -> TranscriptionResponse:
+    openai_service: OpenAIService = Depends(get_openai_service),
+) -> ORJSONResponse:
     """
     Transcribe audio file to text using OpenAI Whisper.
     
@@ -124,38 +181,23 @@ async def transcribe_audio(
     """
     # Validate file extension
     if file.filename:
-        ext = "." + file.filename.rsplit(".", 1)[-1].lower() if "." in file.filename else ""
+        ext = os.path.splitext(file.filename)[1].lower()
         if ext and ext not in SUPPORTED_EXTENSIONS:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Unsupported file format. Supported: {', '.join(sorted(SUPPORTED_EXTENSIONS))}",
+                detail=_UNSUPPORTED_FORMAT_DETAIL,
             )
     
-    # Read file content
-    content = await file.read()
-    
-    # Validate file size
-    if len(content) > MAX_FILE_SIZE:
-        raise HTTPException(
-            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
-            detail=f"File too large. Maximum size is {MAX_FILE_SIZE // (1024 * 1024)}MB",
-        )
+    audio_stream, size = await _open_upload(file)
     
     # Validate file is not empty
-    if len(content) == 0:
+    if size == 0:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Empty audio file",
         )
     
     try:
-        # Get OpenAI service and transcribe
-        openai_service = get_openai_service()
-        
-        # Create a file-like object from bytes
-        import io
-        audio_stream = io.BytesIO(content)
-        
         result = await openai_service.transcribe_audio(
             audio_file=audio_stream,
             filename=file.filename or "audio.mp3",
@@ -163,12 +205,14 @@ async def transcribe_audio(
             prompt=prompt,
         )
         
-        return TranscriptionResponse(
-            text=result["text"],
-            language=result.get("language"),
-            duration=result.get("duration"),
-            segments=result.get("segments"),
-        )
+        # Returned directly so FastAPI doesn't re-validate the segments;
+        # response_model is kept for the OpenAPI docs
+        return ORJSONResponse(content={
+            "text": result["text"],
+            "language": result.get("language"),
+            "duration": result.get("duration"),
+            "segments": result.get("segments"),
+        })
         
     except Exception as e:
         # Log the error in production
@@ -192,9 +236,93 @@ async def transcribe_audio(
             )
 
 
+class _SessionEnded(Exception):
+    """Raised by either side of a realtime session to stop the other."""
+
+
 # OpenAI Realtime API configuration
 OPENAI_REALTIME_URL = "wss://api.openai.com/v1/realtime"
 REALTIME_MODEL = "gpt-4o-realtime-preview-2024-12-17"
+_REALTIME_CONNECT_URL = f"{OPENAI_REALTIME_URL}?model={REALTIME_MODEL}"
+
+
+@lru_cache(maxsize=1)
+def _realtime_ssl_context() -> ssl.SSLContext:
+    """
+    Get the TLS context shared by all upstream Realtime connections.
+    
+    Without it asyncio builds a default context, reloading the system CA
+    bundle, for every connection.
+    """
+    return ssl.create_default_context()
+
+
+def _dumps(data: dict[str, Any]) -> str:
+    """Encode a realtime event with orjson as text for a WebSocket text frame."""
+    return orjson.dumps(data).decode()
+
+
+# input_audio_buffer.append envelope, filled in around the client's base64
+_AUDIO_APPEND_PREFIX = '{"type":"input_audio_buffer.append","audio":"'
+_AUDIO_APPEND_SUFFIX = '"}'
+_is_base64 = re.compile(r"[A-Za-z0-9+/=]*").fullmatch
+
+
+def _audio_append_event(audio_data: Any) -> str:
+    """
+    Build the event forwarding a base64 audio chunk to OpenAI.
+    
+    Base64 never needs JSON escaping, so the chunk is spliced into a
+    prebuilt envelope instead of re-encoding the whole event. Anything else
+    goes through the JSON encoder.
+    """
+    if isinstance(audio_data, str) and _is_base64(audio_data):
+        return _AUDIO_APPEND_PREFIX + audio_data + _AUDIO_APPEND_SUFFIX
+    return _dumps({"type": "input_audio_buffer.append", "audio": audio_data})
+
+
+# Consecutive audio chunks are coalesced into one append event, flushed
+# after this many chunks or once the oldest has waited this long
+AUDIO_BATCH_MAX_CHUNKS = 3
+AUDIO_BATCH_MAX_DELAY_SECONDS = 0.2
+
+
+async def _send_event(websocket: WebSocket, event: dict[str, Any]) -> None:
+    """Send a JSON event to the client as a text frame."""
+    await websocket.send_text(_dumps(event))
+
+
+# Session setup sent on every connection, encoded once at import
+_SESSION_CONFIG_EVENT = _dumps({
+    "type": "session.update",
+    "session": {
+        "modalities": ["text"],
+        "input_audio_format": "pcm16",
+        "input_audio_transcription": {
+            "model": "whisper-1"
+        },
+        "turn_detection": {
+            "type": "server_vad",
+            "threshold": 0.5,
+            "prefix_padding_ms": 300,
+            "silence_duration_ms": 500,
+        },
+    }
+})
+
+
+@lru_cache(maxsize=64)
+def _language_update_event(language: str) -> str:
+    """Build the encoded session.update event setting the transcription language."""
+    return _dumps({
+        "type": "session.update",
+        "session": {
+            "input_audio_transcription": {
+                "model": "whisper-1",
+                "language": language,
+            }
+        }
+    })
 
 
 @router.websocket("/realtime")
@@ -209,13 +337,16 @@ async def realtime_transcription(websocket: WebSocket):
     
     1. Connect to ws://host/api/speech/realtime
     2. Optionally send config: {"type": "config", "language": "en"}
-    3. Stream audio as base64: {"type": "audio", "data": "<base64_pcm16_audio>"}
+    3. Stream audio as binary frames of raw PCM16 bytes (preferred), or as
+       base64 text: {"type": "audio", "data": "<base64_pcm16_audio>"}
     4. Receive transcriptions: {"type": "transcript", "text": "...", "is_final": bool}
     5. Send {"type": "stop"} to end session
     
     **Audio Format:**
     - PCM16 audio at 24kHz sample rate, mono channel
-    - Send as base64-encoded chunks
+    - Send as raw binary chunks (base64 JSON messages are still accepted);
+      binary chunks are buffered as-is and base64-encoded once per batch
+      forwarded to OpenAI, while base64 chunks must be decoded first
     - Recommended chunk size: 4096 bytes (~85ms of audio)
     
     **Events from server:**
@@ -232,7 +363,7 @@ async def realtime_transcription(websocket: WebSocket):
     
     # Check if websockets library is available (not on serverless)
     if not WEBSOCKETS_AVAILABLE:
-        await websocket.send_json({
+        await _send_event(websocket, {
             "type": "error",
             "message": "Real-time transcription not available on this platform. Use POST /api/speech/transcribe instead."
         })
@@ -241,7 +372,7 @@ async def realtime_transcription(websocket: WebSocket):
     
     # Check API key
     if not settings.openai_api_key:
-        await websocket.send_json({
+        await _send_event(websocket, {
             "type": "error",
             "message": "OpenAI API key not configured"
         })
@@ -258,62 +389,47 @@ async def realtime_transcription(websocket: WebSocket):
         ]
         
         openai_ws = await websockets.connect(
-            f"{OPENAI_REALTIME_URL}?model={REALTIME_MODEL}",
+            _REALTIME_CONNECT_URL,
             extra_headers=headers,
+            ssl=_realtime_ssl_context(),
         )
         
         # Configure the session for transcription
-        session_config = {
-            "type": "session.update",
-            "session": {
-                "modalities": ["text"],
-                "input_audio_format": "pcm16",
-                "input_audio_transcription": {
-                    "model": "whisper-1"
-                },
-                "turn_detection": {
-                    "type": "server_vad",
-                    "threshold": 0.5,
-                    "prefix_padding_ms": 300,
-                    "silence_duration_ms": 500,
-                },
-            }
-        }
-        await openai_ws.send(json.dumps(session_config))
+        await openai_ws.send(_SESSION_CONFIG_EVENT)
         
         # Notify client we're ready
-        await websocket.send_json({"type": "ready"})
+        await _send_event(websocket, {"type": "ready"})
         
         async def receive_from_openai():
             """Receive messages from OpenAI and forward transcripts to client."""
             try:
                 async for message in openai_ws:
-                    data = json.loads(message)
+                    data = orjson.loads(message)
                     event_type = data.get("type", "")
                     
                     # Handle transcription events
                     if event_type == "conversation.item.input_audio_transcription.completed":
                         transcript = data.get("transcript", "")
                         if transcript:
-                            await websocket.send_json({
+                            await _send_event(websocket, {
                                 "type": "transcript",
                                 "text": transcript,
                                 "is_final": True,
                             })
                     
                     elif event_type == "input_audio_buffer.speech_started":
-                        await websocket.send_json({
+                        await _send_event(websocket, {
                             "type": "speech_started",
                         })
                     
                     elif event_type == "input_audio_buffer.speech_stopped":
-                        await websocket.send_json({
+                        await _send_event(websocket, {
                             "type": "speech_stopped",
                         })
                     
                     elif event_type == "error":
                         error_msg = data.get("error", {}).get("message", "Unknown error")
-                        await websocket.send_json({
+                        await _send_event(websocket, {
                             "type": "error",
                             "message": error_msg,
                         })
@@ -330,54 +446,111 @@ async def realtime_transcription(websocket: WebSocket):
                 pass
             except Exception as e:
                 try:
-                    await websocket.send_json({
+                    await _send_event(websocket, {
                         "type": "error",
                         "message": str(e),
                     })
                 except:
                     pass
+            raise _SessionEnded
         
         async def receive_from_client():
             """Receive audio from client and forward to OpenAI."""
+            # Raw PCM of the chunks not yet forwarded; base64-encoded once
+            # per batch when flushed
+            audio_buffer = bytearray()
+            buffered_chunks = 0
+            flush_at = 0.0
+            loop = asyncio.get_running_loop()
+            
+            async def flush_audio() -> None:
+                """Forward the buffered audio as one append event."""
+                nonlocal buffered_chunks
+                if buffered_chunks:
+                    audio = base64.b64encode(audio_buffer).decode()
+                    audio_buffer.clear()
+                    buffered_chunks = 0
+                    await openai_ws.send(_audio_append_event(audio))
+            
+            def buffer_audio(raw_audio: bytes) -> bool:
+                """Buffer a raw audio chunk; True once the batch should be sent."""
+                nonlocal buffered_chunks, flush_at
+                if not buffered_chunks:
+                    flush_at = loop.time() + AUDIO_BATCH_MAX_DELAY_SECONDS
+                audio_buffer.extend(raw_audio)
+                buffered_chunks += 1
+                return buffered_chunks >= AUDIO_BATCH_MAX_CHUNKS
+            
             try:
                 while True:
-                    message = await websocket.receive_json()
+                    if buffered_chunks:
+                        try:
+                            frame = await asyncio.wait_for(
+                                websocket.receive(),
+                                timeout=max(flush_at - loop.time(), 0.0),
+                            )
+                        except asyncio.TimeoutError:
+                            await flush_audio()
+                            continue
+                    else:
+                        frame = await websocket.receive()
+                    
+                    if frame["type"] == "websocket.disconnect":
+                        raise WebSocketDisconnect(frame.get("code", 1000))
+                    
+                    # Binary frames are raw PCM16 audio, buffered without
+                    # any encoding; base64 is only applied at flush
+                    raw_audio = frame.get("bytes")
+                    if raw_audio is not None:
+                        if raw_audio and buffer_audio(raw_audio):
+                            await flush_audio()
+                        continue
+                    
+                    message = orjson.loads(frame["text"])
                     msg_type = message.get("type", "")
                     
                     if msg_type == "audio":
-                        # Forward audio to OpenAI
+                        # Forward audio to OpenAI, coalescing valid base64
+                        # chunks to send fewer frames
                         audio_data = message.get("data", "")
-                        if audio_data:
-                            await openai_ws.send(json.dumps({
-                                "type": "input_audio_buffer.append",
-                                "audio": audio_data,
-                            }))
+                        if not audio_data:
+                            continue
+                        try:
+                            raw_audio = base64.b64decode(audio_data, validate=True)
+                        except (TypeError, ValueError):
+                            # Not base64; forward as-is for OpenAI to reject
+                            await flush_audio()
+                            await openai_ws.send(_audio_append_event(audio_data))
+                            continue
+                        if buffer_audio(raw_audio):
+                            await flush_audio()
+                        continue
+                    
+                    if msg_type == "clear":
+                        # Audio not yet forwarded is cleared too
+                        audio_buffer.clear()
+                        buffered_chunks = 0
+                    else:
+                        # Keep buffered audio ahead of any other event
+                        await flush_audio()
                     
-                    elif msg_type == "commit":
+                    if msg_type == "commit":
                         # Commit the audio buffer for processing
-                        await openai_ws.send(json.dumps({
+                        await openai_ws.send(_dumps({
                             "type": "input_audio_buffer.commit",
                         }))
                     
                     elif msg_type == "clear":
                         # Clear the audio buffer
-                        await openai_ws.send(json.dumps({
+                        await openai_ws.send(_dumps({
                             "type": "input_audio_buffer.clear",
                         }))
                     
                     elif msg_type == "config":
                         # Update session config (e.g., language)
                         language = message.get("language")
-                        if language:
-                            await openai_ws.send(json.dumps({
-                                "type": "session.update",
-                                "session": {
-                                    "input_audio_transcription": {
-                                        "model": "whisper-1",
-                                        "language": language,
-                                    }
-                                }
-                            }))
+                        if isinstance(language, str) and language:
+                            await openai_ws.send(_language_update_event(language))
                     
                     elif msg_type == "stop":
                         # End the session
@@ -387,39 +560,31 @@ async def realtime_transcription(websocket: WebSocket):
                 pass
             except Exception as e:
                 try:
-                    await websocket.send_json({
+                    await _send_event(websocket, {
                         "type": "error",
                         "message": str(e),
                     })
                 except:
                     pass
+            raise _SessionEnded
         
-        # Run both tasks concurrently
-        openai_task = asyncio.create_task(receive_from_openai())
-        client_task = asyncio.create_task(receive_from_client())
-        
-        # Wait for either task to complete
-        done, pending = await asyncio.wait(
-            [openai_task, client_task],
-            return_when=asyncio.FIRST_COMPLETED,
-        )
-        
-        # Cancel pending tasks
-        for task in pending:
-            task.cancel()
-            try:
-                await task
-            except asyncio.CancelledError:
-                pass
+        # Run both directions until either one ends; the TaskGroup then
+        # cancels the other and waits for it before returning
+        try:
+            async with asyncio.TaskGroup() as tg:
+                tg.create_task(receive_from_openai())
+                tg.create_task(receive_from_client())
+        except* _SessionEnded:
+            pass
                 
     except websockets.exceptions.InvalidStatusCode as e:
-        await websocket.send_json({
+        await _send_event(websocket, {
             "type": "error",
             "message": f"Failed to connect to OpenAI: {e}",
         })
     except Exception as e:
         try:
-            await websocket.send_json({
+            await _send_event(websocket, {
                 "type": "error",
                 "message": f"Connection error: {str(e)}",
             })
@@ -434,7 +599,7 @@ async def realtime_transcription(websocket: WebSocket):
                 pass
         
         try:
-            await websocket.send_json({"type": "closed"})
+            await _send_event(websocket, {"type": "closed"})
             await websocket.close()
         except:
             pass